@@ -123,6 +123,28 @@ class VehicleInstance:
         return False
 
 
+class RadarFlash:
+    __slots__ = ("cells", "on_enemy", "state", "state_time", "blink_on", "blink_off", "blinks_left")
+
+    def __init__(self, cells, on_enemy, blinks_left=2):
+        self.cells = frozenset(cells)
+        self.on_enemy = on_enemy
+        self.state = "on"
+        self.state_time = 0.0
+        self.blink_on = RADAR_BLINK_ON_MS / 1000.0
+        self.blink_off = RADAR_BLINK_OFF_MS / 1000.0
+        self.blinks_left = blinks_left
+
+
+class BannerEntry:
+    __slots__ = ("text", "sub", "timer")
+
+    def __init__(self, text, sub=None, timer=1.2):
+        self.text = text
+        self.sub = sub
+        self.timer = timer
+
+
 class Board:
     def __init__(self):
         self.vehicles = []  # includes mines
@@ -567,6 +589,7 @@ class BattleConvoyScene(Scene):
         self.placing_index = 0
         self.current_rot = 0
         self.placement_left = PLACEMENT_LIMIT_S
+        self._ghost_last = None  # ((cell, rot, index), ok, rc) for the placement ghost
 
         self.phase = "PLACEMENT"
         self.player_turn = True if (not self.net_enabled or self.opponent_is_bot or self.local_starts) else False
@@ -587,6 +610,12 @@ class BattleConvoyScene(Scene):
 
         self.fog_tile = pygame.Surface((self.cw, self.ch), pygame.SRCALPHA)
         self.fog_tile.fill((0, 0, 0, 90))
+        self.radar_tile = pygame.Surface((self.cw, self.ch), pygame.SRCALPHA)
+        self.radar_tile.fill((238, 220, 130, 110))
+        self._tint_ok = pygame.Surface((self.cw, self.ch), pygame.SRCALPHA)
+        self._tint_ok.fill((80, 200, 120, 80))
+        self._tint_bad = pygame.Surface((self.cw, self.ch), pygame.SRCALPHA)
+        self._tint_bad.fill((220, 80, 80, 90))
 
         self.top_band_rect = pygame.Rect(
             self.right_origin[0], self.right_origin[1] - self.ch, GRID_SIZE * self.cw, self.ch
@@ -596,7 +625,7 @@ class BattleConvoyScene(Scene):
         )
 
     def _push_banner(self, text, sub=None, seconds=1.2):
-        self.banner_queue.append({"text": text, "sub": sub, "timer": seconds})
+        self.banner_queue.append(BannerEntry(text, sub, seconds))
 
     def _auto_place_remaining(self, board, start_idx):
         for i in range(start_idx, len(self.placement_list)):
@@ -723,15 +752,7 @@ class BattleConvoyScene(Scene):
         else:
             cells = {(cx, cy)}
             blinks = 2
-        self.radar_flash = {
-            "cells": cells,
-            "on_enemy": shooter_is_player,
-            "state": "on",
-            "state_time": 0.0,
-            "blink_on": RADAR_BLINK_ON_MS / 1000.0,
-            "blink_off": RADAR_BLINK_OFF_MS / 1000.0,
-            "blinks_left": blinks,
-        }
+        self.radar_flash = RadarFlash(cells, shooter_is_player, blinks)
         r["radar_cells"] = list(cells)
         return r
 
@@ -760,7 +781,7 @@ class BattleConvoyScene(Scene):
         self.pending_outcome = outcome
         self.phase = "END"
         title = "VICTORY" if outcome == "win" else "DEFEAT" if outcome == "lose" else "FORFEIT"
-        self.end_banner = {"text": title, "sub": subtitle, "timer": BANNER_ENDGAME_S}
+        self.end_banner = BannerEntry(title, subtitle, BANNER_ENDGAME_S)
         if not self.pending_payload:
             self._capture_payload(outcome)
 
@@ -826,6 +847,9 @@ class BattleConvoyScene(Scene):
     def _net_poll_actions(self):
         if not self.net_enabled or not self.net_client:
             return
+        pending = getattr(self.net_client, "pending_duel_actions", None)
+        if pending is not None and not pending(self.duel_id):
+            return
         while True:
             msg = self.net_client.pop_duel_action(self.duel_id)
             if not msg:
@@ -882,15 +906,7 @@ class BattleConvoyScene(Scene):
         for c in action.get("misses", []):
             self.enemy.misses.add(tuple(c))
         if action.get("radar_cells"):
-            self.radar_flash = {
-                "cells": set(tuple(c) for c in action.get("radar_cells")),
-                "on_enemy": True,
-                "state": "on",
-                "state_time": 0.0,
-                "blink_on": RADAR_BLINK_ON_MS / 1000.0,
-                "blink_off": RADAR_BLINK_OFF_MS / 1000.0,
-                "blinks_left": 2,
-            }
+            self.radar_flash = RadarFlash(map(tuple, action.get("radar_cells")), True)
         if action.get("opponent_defeated"):
             self._set_result("win", "Enemy convoy destroyed")
             return
@@ -928,12 +944,16 @@ class BattleConvoyScene(Scene):
                 res = {"hit_any": False, "end_turn": True, "result": "repeat", "cell": tuple(tgt)}
         if res:
             end_turn = res.get("end_turn", True)
-            hits = res.get("hits", [])
-            misses = res.get("misses", [])
-            if res.get("result") == "hit" and res.get("cell") is not None:
-                hits.append(tuple(res["cell"]))
-            if res.get("result") == "miss" and res.get("cell") is not None:
-                misses.append(tuple(res["cell"]))
+            # Build fresh lists: res["hits"]/res["misses"] belong to the shot helpers.
+            hits = [(int(x), int(y)) for x, y in res.get("hits") or ()]
+            misses = [(int(x), int(y)) for x, y in res.get("misses") or ()]
+            result = res.get("result")
+            cell = res.get("cell")
+            if cell is not None:
+                if result == "hit":
+                    hits.append((int(cell[0]), int(cell[1])))
+                elif result == "miss":
+                    misses.append((int(cell[0]), int(cell[1])))
             radar_cells = res.get("radar_cells", [])
 
         self._check_victory_after_enemy_action()
@@ -945,8 +965,8 @@ class BattleConvoyScene(Scene):
             "kind": "shot_result",
             "action_id": action.get("action_id"),
             "mode": mode,
-            "hits": [(int(x), int(y)) for x, y in hits],
-            "misses": [(int(x), int(y)) for x, y in misses],
+            "hits": hits,
+            "misses": misses,
             "end_turn": end_turn,
             "radar_cells": radar_cells,
             "opponent_defeated": False,
@@ -1015,6 +1035,7 @@ class BattleConvoyScene(Scene):
                 elif event.key == pygame.K_BACKSPACE:
                     self.player.undo_last()
                     self.placing_index = max(0, self.placing_index - 1)
+                    self._ghost_last = None
             elif (
                 event.type == pygame.MOUSEBUTTONDOWN
                 and event.button == 1
@@ -1028,6 +1049,7 @@ class BattleConvoyScene(Scene):
                     if self.player.can_place(inst):
                         self.player.place(inst)
                         self.placing_index += 1
+                        self._ghost_last = None
                         if self.placing_index >= len(self.placement_list):
                             self._net_mark_player_ready()
             return
@@ -1162,8 +1184,8 @@ class BattleConvoyScene(Scene):
         self._net_poll_actions()
         if self.pending_outcome:
             if self.end_banner:
-                self.end_banner["timer"] -= dt
-                if self.end_banner["timer"] <= 0:
+                self.end_banner.timer -= dt
+                if self.end_banner.timer <= 0:
                     self._finalize(self.pending_outcome)
             else:
                 self._finalize(self.pending_outcome)
@@ -1189,19 +1211,20 @@ class BattleConvoyScene(Scene):
                 self.player_special_ready = True
             if not self.player_turn:
                 self.player_special_mode = None
-            if self.radar_flash:
-                self.radar_flash["state_time"] += dt
-                if self.radar_flash["state"] == "on":
-                    if self.radar_flash["state_time"] >= self.radar_flash["blink_on"]:
-                        self.radar_flash["state"] = "off"
-                        self.radar_flash["state_time"] = 0.0
-                        self.radar_flash["blinks_left"] -= 1
-                        if self.radar_flash["blinks_left"] <= 0:
+            rf = self.radar_flash
+            if rf:
+                rf.state_time += dt
+                if rf.state == "on":
+                    if rf.state_time >= rf.blink_on:
+                        rf.state = "off"
+                        rf.state_time = 0.0
+                        rf.blinks_left -= 1
+                        if rf.blinks_left <= 0:
                             self.radar_flash = None
-                elif self.radar_flash["state"] == "off":
-                    if self.radar_flash["state_time"] >= self.radar_flash["blink_off"]:
-                        self.radar_flash["state"] = "on"
-                        self.radar_flash["state_time"] = 0.0
+                elif rf.state == "off":
+                    if rf.state_time >= rf.blink_off:
+                        rf.state = "on"
+                        rf.state_time = 0.0
             if self.net_enabled and not self.opponent_is_bot:
                 # PvP: only tick timer on our turn; auto-fire if time expires.
                 if self.player_turn and not self.awaiting_result:
@@ -1225,8 +1248,8 @@ class BattleConvoyScene(Scene):
                             self._enemy_take_turn()
 
         if self.banner_queue:
-            self.banner_queue[0]["timer"] -= dt
-            if self.banner_queue[0]["timer"] <= 0:
+            self.banner_queue[0].timer -= dt
+            if self.banner_queue[0].timer <= 0:
                 self.banner_queue.pop(0)
 
     def draw(self):
@@ -1257,20 +1280,31 @@ class BattleConvoyScene(Scene):
                     screen.blit(self.fog_tile, (self.right_origin[0] + x * self.cw, self.right_origin[1] + y * self.ch))
         draw_hits_misses(screen, self.right_origin, self.cw, self.ch, self.enemy.hits, self.enemy.misses)
 
-        if self.radar_flash and self.radar_flash.get("state") == "on":
-            origin = self.right_origin if self.radar_flash["on_enemy"] else self.left_origin
-            hi = pygame.Surface((self.cw, self.ch), pygame.SRCALPHA)
-            hi.fill((238, 220, 130, 110))
-            for cx, cy in self.radar_flash["cells"]:
+        rf = self.radar_flash
+        if rf and rf.state == "on":
+            origin = self.right_origin if rf.on_enemy else self.left_origin
+            hi = self.radar_tile
+            for cx, cy in rf.cells:
                 screen.blit(hi, (origin[0] + cx * self.cw, origin[1] + cy * self.ch))
 
         if self.phase == "PLACEMENT" and self.placing_index < len(self.placement_list):
-            m = cell_from_mouse(self.left_origin, self.cw, self.ch, pygame.mouse.get_pos())
+            # Inlined cell_from_mouse: this runs every frame while placing.
+            mx, my = pygame.mouse.get_pos()
+            col = (mx - self.left_origin[0]) // self.cw
+            row = (my - self.left_origin[1]) // self.ch
+            m = (col, row) if 0 <= col < GRID_SIZE and 0 <= row < GRID_SIZE else None
             name, base, is_mine = self.placement_list[self.placing_index]
             if m is not None:
-                ghost = VehicleInstance(name, base, is_mine, origin=m, rot=(0 if is_mine else self.current_rot))
-                ok = self.player.can_place(ghost)
-                rc = normalize_to_origin([rot_cell(c, ghost.rot) for c in base])
+                rot = 0 if is_mine else self.current_rot
+                key = (m, rot, self.placing_index)
+                cached = self._ghost_last
+                if cached is not None and cached[0] == key:
+                    ok, rc = cached[1], cached[2]
+                else:
+                    ghost = VehicleInstance(name, base, is_mine, origin=m, rot=rot)
+                    ok = self.player.can_place(ghost)
+                    rc = normalize_to_origin([rot_cell(c, rot) for c in base])
+                    self._ghost_last = (key, ok, rc)
                 w, h = bbox_size(rc)
                 temp = pygame.Surface((w * self.cw, h * self.ch), pygame.SRCALPHA)
                 blit_piece_cells(
@@ -1282,11 +1316,10 @@ class BattleConvoyScene(Scene):
                     self.ch,
                     (0, 0),
                     base,
-                    ghost.rot,
+                    rot,
                     alpha=200,
                 )
-                tint = pygame.Surface((self.cw, self.ch), pygame.SRCALPHA)
-                tint.fill((80, 200, 120, 80) if ok else (220, 80, 80, 90))
+                tint = self._tint_ok if ok else self._tint_bad
                 for cx, cy in rc:
                     src = pygame.Rect(cx * self.cw, cy * self.ch, self.cw, self.ch)
                     tile = temp.subsurface(src).copy()
@@ -1317,12 +1350,12 @@ class BattleConvoyScene(Scene):
         draw_side_icon_columns(screen, self.sprite_map, icon_names, self.enemy, self.player, self.sx, self.sy)
 
         if self.banner_queue:
-            panel = banner(screen.get_size(), self.banner_queue[0]["text"], self.banner_queue[0]["sub"])
+            panel = banner(screen.get_size(), self.banner_queue[0].text, self.banner_queue[0].sub)
             rect = panel.get_rect(center=(self.w // 2, int(120 * self.sy)))
             screen.blit(panel, rect)
 
         if self.end_banner:
-            panel = banner(screen.get_size(), self.end_banner["text"], self.end_banner["sub"])
+            panel = banner(screen.get_size(), self.end_banner.text, self.end_banner.sub)
             rect = panel.get_rect(center=(self.w // 2, int(160 * self.sy)))
             screen.blit(panel, rect)
 
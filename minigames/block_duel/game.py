@@ -1,4 +1,6 @@
-import pygame, random, time, uuid
+import pygame, time, uuid, zlib
+from collections import deque
+from itertools import islice
 from scene_manager import Scene
 from content_registry import load_game_fonts
 from game_context import GameContext
@@ -46,8 +48,200 @@ POWER_COST = {
     P_CLEANSELF: 24,
 }
 
+# Power bound to each BUTTON_SLOTS entry, and the 1-5 keyboard shortcuts.
+BUTTON_PIDS = (P_SPEED_EN, P_FORCEDROP, P_GARBAGE1, P_STEAL_NEXT, P_CLEANSELF)
+KEY_TO_PID = {
+    pygame.K_1: P_SPEED_EN,
+    pygame.K_2: P_FORCEDROP,
+    pygame.K_3: P_GARBAGE1,
+    pygame.K_4: P_STEAL_NEXT,
+    pygame.K_5: P_CLEANSELF,
+}
+# (left, top, right, bottom, pid) per button for click hit-testing.
+BUTTON_BOXES = tuple((r.x, r.y, r.right, r.bottom, pid) for r, pid in zip(BUTTON_SLOTS, BUTTON_PIDS))
+
 CONFIRM_WINDOW_MS = 1200
 FLASH_DURATION_MS = 300
+FLASH_STEPS = 8  # pulse levels for a flashing power label
+TEXT_CACHE_MAX = 256
+NET_BATCH_MAX = 8  # queued duel actions before an early flush
+NET_POLL_MAX = 32  # inbound duel messages handled per frame; the rest wait in the queue
+NET_FULL_EVERY = 5  # state sends between full board snapshots (deltas in between)
+# Wire format version carried by every state message. Bump it whenever the duel
+# protocol changes (bag RNG, action envelopes, state encoding); peers on another
+# version (or none, i.e. older builds) end the duel instead of desyncing.
+NET_PROTOCOL = 2
+
+# Board <-> wire row strings ("." empty, shape letter, "X" garbage) via bytes.translate.
+_PACK_TABLE = bytes.maketrans(
+    bytes([EMPTY, GARBAGE] + list(ID_SHAPE)),
+    ("." + "X" + "".join(ID_SHAPE.values())).encode("ascii"),
+)
+_UNPACK_TABLE = bytearray([GARBAGE]) * 256  # unknown symbols count as garbage
+_UNPACK_TABLE[ord(".")] = EMPTY
+for _name, _sid in SHAPE_ID.items():
+    _UNPACK_TABLE[ord(_name)] = _sid
+_UNPACK_TABLE = bytes(_UNPACK_TABLE)
+del _name, _sid
+GARBAGE_ROW = bytes((GARBAGE,)) * GRID_W
+SHAPE_NAMES = tuple(SHAPES)
+
+# PauseMenuScene is imported lazily on first pause, like the other minigames;
+# the result, or the failure, is remembered so later pauses skip the import.
+_PauseMenuScene = None
+_pause_import_tried = False
+
+# Fixed layout in base-surface coordinates.
+ENEMY_BOARD_X = BASE_W - BOARD_X - GRID_W * CELL
+# Top-left corners of the two 17px tally dots beside each well.
+P_TALLY_POS = tuple((BOARD_X + GRID_W * CELL + 100 + i * 24 - 8, BOARD_Y + GRID_H * CELL - 108) for i in range(2))
+E_TALLY_POS = tuple((ENEMY_BOARD_X - 120 + i * 24 - 8, BOARD_Y + GRID_H * CELL - 108) for i in range(2))
+
+
+def _rotate_offsets(pts, rot):
+    out = []
+    for x, y in pts:
+        for _ in range(rot % 4):
+            x, y = y, -x
+        out.append((x, y))
+    return tuple(out)
+
+
+# Rotated cell offsets per shape, indexed [shape][rot & 3].
+ROTATED_CELLS = {shape: tuple(_rotate_offsets(pts, r) for r in range(4)) for shape, pts in SHAPES.items()}
+
+
+def _column_footprint(offsets):
+    cols = {}
+    for dx, dy in offsets:
+        cols.setdefault(dx, []).append(dy)
+    return tuple((dx, tuple(sorted(dys))) for dx, dys in sorted(cols.items()))
+
+
+# Same offsets grouped by column: [shape][rot] -> ((dx, (dy, ...)), ...) sorted by dx.
+ROTATED_FOOTPRINTS = {shape: tuple(_column_footprint(o) for o in rots) for shape, rots in ROTATED_CELLS.items()}
+
+
+def _plan_enemy(board, shape, cur_x, cur_rot):
+    """Score every straight drop of ``shape`` and return the best (x, rot).
+
+    Works from per-column tops/holes of the current board instead of copying
+    and rescanning the whole board for each candidate.
+    """
+    # below[c][r]: first filled row >= r in column c (GRID_H if none).
+    below = []
+    tops = [GRID_H] * GRID_W
+    base_holes = 0
+    for c in range(GRID_W):
+        col = [GRID_H] * (GRID_H + 1)
+        nxt = GRID_H
+        for r in range(GRID_H - 1, -1, -1):
+            if board[r * GRID_W + c]:
+                nxt = r
+            col[r] = nxt
+        below.append(col)
+        tops[c] = col[0]
+        for r in range(col[0] + 1, GRID_H):
+            if not board[r * GRID_W + c]:
+                base_holes += 1
+    heights = [GRID_H - t for t in tops]
+
+    best_x, best_rot, best_score = cur_x, cur_rot, 9999
+    footprints = ROTATED_FOOTPRINTS[shape]
+    for rot in range(4):
+        cols = footprints[rot]
+        # Only x positions that keep every column on the board can land.
+        x_lo = max(-2, -cols[0][0])
+        x_hi = min(GRID_W + 2, GRID_W - cols[-1][0])
+        for x in range(x_lo, x_hi):
+            # Landing row: the piece spawns at y=0 and stops on the first
+            # block under any of its cells.
+            y = GRID_H
+            for dx, dys in cols:
+                col_below = below[x + dx]
+                for dy in dys:
+                    land = col_below[dy if dy > 0 else 0] - 1 - dy
+                    if land < y:
+                        y = land
+            if y < 0:
+                continue
+            hs = heights[:]
+            holes = base_holes
+            for dx, dys in cols:
+                c = x + dx
+                top = tops[c]
+                nt = top
+                n = 0
+                for dy in dys:
+                    r = y + dy
+                    if r >= 0:
+                        n += 1
+                        if r < nt:
+                            nt = r
+                if n:
+                    # Placed cells fill empties; anything left under the new top is a hole.
+                    holes += top - nt - n
+                    hs[c] = GRID_H - nt
+            bump = 0
+            for i in range(GRID_W - 1):
+                bump += abs(hs[i] - hs[i + 1])
+            score = max(hs) + holes * 2 + bump * 0.5
+            if score < best_score:
+                best_score, best_x, best_rot = score, x, rot
+    return best_x, best_rot
+
+
+def _fits(board, offsets, px, py, _w=GRID_W, _h=GRID_H):
+    """True if a piece with ``offsets`` at (px, py) is on the board and clear."""
+    for dx, dy in offsets:
+        x = px + dx
+        y = py + dy
+        if not 0 <= x < _w or y >= _h:
+            return False
+        if y >= 0 and board[y * _w + x]:
+            return False
+    return True
+
+
+def _stamp(board, offsets, px, py, value, _w=GRID_W, _h=GRID_H):
+    """Write ``value`` into every on-board cell of a piece at (px, py)."""
+    for dx, dy in offsets:
+        x = px + dx
+        y = py + dy
+        if 0 <= y < _h and 0 <= x < _w:
+            board[y * _w + x] = value
+
+
+def _get_int(d, key, default):
+    """``d[key]`` as an int, or ``default`` when it is missing or None."""
+    val = d.get(key)
+    return default if val is None else int(val)
+
+
+class BagRng:
+    """xorshift32 stream for the shared piece bag.
+
+    Seeded from a CRC of the duel id so every peer derives the same
+    sequence without depending on the stdlib Random implementation.
+    """
+
+    __slots__ = ("state",)
+
+    def __init__(self, seed):
+        self.state = zlib.crc32(str(seed).encode("utf-8")) or 0x9E3779B9
+
+    def next(self):
+        x = self.state
+        x ^= (x << 13) & 0xFFFFFFFF
+        x ^= x >> 17
+        x ^= (x << 5) & 0xFFFFFFFF
+        self.state = x
+        return x
+
+    def shuffle(self, seq):
+        for i in range(len(seq) - 1, 0, -1):
+            j = self.next() % (i + 1)
+            seq[i], seq[j] = seq[j], seq[i]
 
 
 # --- Main Scene ---------------------------------------------------------------
@@ -60,8 +254,54 @@ class BlockDuelScene(Scene):
         self.screen = manager.screen
         self.w, self.h = manager.size
         self.base_surf = pygame.Surface((BASE_W, BASE_H)).convert()
-        self.bg = load_background()
+        # The art is drawn at base resolution and only ever blitted onto base_surf,
+        # so crop it to that size once instead of rescaling it per frame.
+        bg = load_background()
+        bw, bh = min(BASE_W, bg.get_width()), min(BASE_H, bg.get_height())
+        self.bg = bg.subsurface((0, 0, bw, bh)).convert()
+        self.cell_tiles = make_cell_tiles(CELL)
+        # Regions of base_surf that change every frame: both wells and the
+        # centre chute (dispenser + next slots). HUD text/tally rects are
+        # collected while drawing and restored on the following frame.
+        self._chute_rect = pygame.Rect(BASE_W // 2 - 100, 112, 200, 220)
+        self._static_dirty = (
+            pygame.Rect(BOARD_X, BOARD_Y, GRID_W * CELL, GRID_H * CELL),
+            pygame.Rect(ENEMY_BOARD_X, BOARD_Y, GRID_W * CELL, GRID_H * CELL),
+            self._chute_rect,
+        )
+        # Dispenser + next slots only change when a piece is drawn or swapped.
+        self._chute_surf = pygame.Surface(self._chute_rect.size, pygame.SRCALPHA)
+        self._chute_key = None
+        # Tally dots (radius 8) prerendered once per colour.
+        self._tally_dots = {}
+        for color in ((255, 255, 0), (255, 100, 100), (80, 80, 80), (255, 255, 255)):
+            dot = pygame.Surface((17, 17), pygame.SRCALPHA)
+            pygame.draw.circle(dot, color, (8, 8), 8)
+            self._tally_dots[color] = dot
+        self._dirty_rects = None  # None -> repaint the whole background next frame
         self.font_big, self.font, self.font_small = load_game_fonts()
+        self._text_cache = {}
+        # Per power button: (rect, pid, white label, armed label, flash labels,
+        # label pos, cost text, cost pos).
+        self._power_hud = []
+        for rect, pid in zip(BUTTON_SLOTS, BUTTON_PIDS):
+            label = self._render(self.font_small, POWER_LABEL[pid], (255, 255, 255))
+            armed = self._render(self.font_small, POWER_LABEL[pid], (255, 255, 120))
+            flash = [
+                self._render(self.font_small, POWER_LABEL[pid], (255, 255 - step * 32, 255 - step * 32))
+                for step in range(FLASH_STEPS)
+            ]
+            cost = self._render(self.font_small, f"{POWER_COST[pid]}¢", (255, 255, 0))
+            self._power_hud.append((
+                rect,
+                pid,
+                label,
+                armed,
+                flash,
+                (rect.centerx - label.get_width() // 2 - 6, rect.y),
+                cost,
+                (rect.centerx - cost.get_width() // 2 - 6, rect.y + 20),
+            ))
         self.minigame_id = "block_duel"
         self.banner = EndBanner(
             duration=2.0,
@@ -97,24 +337,49 @@ class BlockDuelScene(Scene):
 
         # Shared deterministic stream so both players draw from the same middle chute.
         self._rng_seed = self.duel_id or "block-duel"
-        self._rng = random.Random(self._rng_seed)
+        self._rng = BagRng(self._rng_seed)
 
         self._net_state_timer = 0.0
         self._net_state_interval = 0.20
+        self._pending_net_actions = []
+        self._net_handlers = {
+            "state": self._net_apply_state,
+            "power": self._net_apply_power,
+            "outcome": self._net_apply_outcome,
+            "draw": self._net_apply_draw,
+        }
+        self._opponent_powers = {
+            P_GARBAGE1: self._opp_garbage,
+            P_SPEED_EN: self._opp_speed,
+            P_FORCEDROP: self._opp_forcedrop,
+            P_STEAL_NEXT: self._opp_steal_next,
+            P_CLEANSELF: self._opp_cleanself,
+        }
         self.reset()
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        self._remaining = float(MATCH_TIME)  # refreshed once per update(), read by draw()
+        self._frame_ms = pygame.time.get_ticks()
         self._blit_scale = 1.0
         self._blit_offset = (0, 0)
+        self._scaled_buf = None
+        self._scaled_size = (BASE_W, BASE_H)
+        self._scaled_stale = True
+        self._present_size = None
 
     # -------------------------------------------------------------------------
     def reset(self):
         self.pending_payload = {}
         self.pending_outcome = None
         self._completed = False
-        self.player_board = [[None for _ in range(GRID_W)] for _ in range(GRID_H)]
-        self.enemy_board = [[None for _ in range(GRID_W)] for _ in range(GRID_H)]
+        if hasattr(self, "player_board"):
+            clear_board(self.player_board)
+            clear_board(self.enemy_board)
+        else:
+            self.player_board = new_board()
+            self.enemy_board = new_board()
+        self._cell_cache = {}
         self.bag = []
-        self.shared_queue = [self._new_shape() for _ in range(6)]
+        self.shared_queue = deque(self._new_shapes(6))
         self.player_next = self._draw_piece()
         self.enemy_next = self._draw_piece()
 
@@ -128,6 +393,7 @@ class BlockDuelScene(Scene):
         self.enemy_next = self._draw_piece()
         self.enemy_pos = [3, 0]
         self.enemy_rot = 0
+        self.enemy_plan = None  # AI target {"shape", "x", "rot", "rest"} for the current piece
 
         # timers and stats
         self.timer = 0
@@ -145,6 +411,8 @@ class BlockDuelScene(Scene):
         self.enemy_game_over = False
         self.final_winner = None
         self._outcome_sent = False
+        self._base_frozen = False
+        self._frame_stale = True  # state may have changed since base_surf was composed
 
         # tallies (now 2 instead of 3)
         self.attack_count = 0
@@ -162,45 +430,70 @@ class BlockDuelScene(Scene):
         self.enemy_ready = not self.net_enabled
         self.battle_started = not self.net_enabled
         self._net_state_timer = 0.0
+        # Last state sent, so unchanged ticks are skipped and boards go out as row deltas.
+        self._last_sent_rows = None
+        self._last_sent_meta = None
+        self._net_sends_since_full = 0
+        # Last full enemy snapshot applied and the board bytes it produced.
+        self._last_enemy_packed = None
+        self._enemy_board_seen = None
 
     # -------------------------------------------------------------------------
     def _new_shape(self):
         if not self.bag:
-            self.bag = list(SHAPES.keys())
+            self.bag = list(SHAPE_NAMES)
             self._rng.shuffle(self.bag)
         return self.bag.pop()
 
+    def _new_shapes(self, k):
+        """Next ``k`` shapes, in the same order as k calls to _new_shape()."""
+        out = []
+        bag = self.bag
+        while k > 0:
+            if not bag:
+                bag = self.bag = list(SHAPE_NAMES)
+                self._rng.shuffle(bag)
+            take = min(k, len(bag))
+            out.extend(bag[:-take - 1:-1])
+            del bag[-take:]
+            k -= take
+        return out
+
     def _cells(self, shape, pos, rot):
-        pts = []
-        for x, y in SHAPES[shape]:
-            for _ in range(rot % 4):
-                x, y = y, -x
-            pts.append((pos[0] + x, pos[1] + y))
-        return pts
-
-    def _valid(self, board, cells):
+        # draw() looks up the same pose every frame until the piece moves,
+        # so keep the falling pieces' cells until the next spawn.
+        px, py = pos
+        key = (shape, px, py, rot)
+        cells = self._cell_cache.get(key)
+        if cells is None:
+            cells = tuple((px + dx, py + dy) for dx, dy in ROTATED_CELLS[shape][rot & 3])
+            self._cell_cache[key] = cells
+        return cells
+
+    def _valid(self, board, cells, _w=GRID_W, _h=GRID_H):
         for x, y in cells:
-            if x < 0 or x >= GRID_W or y >= GRID_H:
+            if not 0 <= x < _w or y >= _h:
                 return False
-            if y >= 0 and board[y][x]:
+            if y >= 0 and board[y * _w + x]:
                 return False
         return True
 
     def _lock(self, board, shape, pos, rot):
-        for x, y in self._cells(shape, pos, rot):
-            if 0 <= y < GRID_H and 0 <= x < GRID_W:
-                board[y][x] = shape
+        _stamp(board, ROTATED_CELLS[shape][rot & 3], pos[0], pos[1], SHAPE_ID[shape])
 
     def _add_garbage(self, board, n=1):
-        for _ in range(n):
-            del board[0]
-            board.append(["X"] * GRID_W)
+        n = min(n, GRID_H)
+        if n <= 0:
+            return
+        # Shift everything up n rows and fill the bottom with garbage in one move.
+        del board[:n * GRID_W]
+        board.extend(GARBAGE_ROW * n)
 
     def _draw_piece(self):
         """Draw the next piece from the shared chute; broadcast to opponent if multiplayer."""
         if not self.shared_queue:
-            self.shared_queue = [self._new_shape() for _ in range(6)]
-        piece = self.shared_queue.pop(0)
+            self.shared_queue.extend(self._new_shapes(6))
+        piece = self.shared_queue.popleft()
         self.shared_queue.append(self._new_shape())
         if self.net_enabled and self.net_client and self.duel_id:
             try:
@@ -210,6 +503,7 @@ class BlockDuelScene(Scene):
         return piece
 
     def _spawn_player(self):
+        self._cell_cache.clear()
         self.shape = self.player_next
         self.player_next = self._draw_piece()
         self.pos = [3, 0]
@@ -220,6 +514,7 @@ class BlockDuelScene(Scene):
             self.game_over = True
 
     def _spawn_enemy(self):
+        self._cell_cache.clear()
         self.enemy_shape = self.enemy_next
         self.enemy_next = self._draw_piece()
         self.enemy_pos = [3, 0]
@@ -231,17 +526,18 @@ class BlockDuelScene(Scene):
             self.enemy_game_over = True
 
     def _move(self, board, shape, pos, rot, dx, dy):
-        new_pos = [pos[0] + dx, pos[1] + dy]
-        if self._valid(board, self._cells(shape, new_pos, rot)):
-            return new_pos
+        nx, ny = pos[0] + dx, pos[1] + dy
+        if _fits(board, ROTATED_CELLS[shape][rot & 3], nx, ny):
+            return [nx, ny]
         return pos
 
     def _rotate(self, board, shape, pos, rot):
         new_rot = (rot + 1) % 4
-        if self._valid(board, self._cells(shape, pos, new_rot)):
+        offsets = ROTATED_CELLS[shape][new_rot]
+        if _fits(board, offsets, pos[0], pos[1]):
             return new_rot
         for kick in (-1, 1, -2, 2):
-            if self._valid(board, self._cells(shape, [pos[0] + kick, pos[1]], new_rot)):
+            if _fits(board, offsets, pos[0] + kick, pos[1]):
                 pos[0] += kick
                 return new_rot
         return rot
@@ -250,11 +546,12 @@ class BlockDuelScene(Scene):
         cleared = 0
         r = GRID_H - 1
         while r >= 0:
-            row = board[r]
-            # Only clear lines that are full and NOT all garbage
-            if all(row) and all(cell != "X" for cell in row):
-                del board[r]
-                board.insert(0, [None if cell != "X" else "X" for cell in row])
+            start = r * GRID_W
+            row = board[start:start + GRID_W]
+            # Only clear lines that are full and contain no garbage
+            if EMPTY not in row and GARBAGE not in row:
+                del board[start:start + GRID_W]
+                board[:0] = bytes(GRID_W)
                 cleared += 1
             else:
                 r -= 1
@@ -267,10 +564,13 @@ class BlockDuelScene(Scene):
                 if cleared == 4:
                     self.attack_count += 1
                     if self.attack_count >= 2:
-                        self._add_garbage(self.enemy_board, 1)
+                        # In PvP the mirrored enemy board is the opponent's own
+                        # state (patched by row deltas); don't shift it locally.
+                        if not self.net_enabled:
+                            self._add_garbage(self.enemy_board, 1)
                         self.attack_count = 0
                         self.flash_active_p = True
-                        self.flash_timer_p = pygame.time.get_ticks()
+                        self.flash_timer_p = self._frame_ms
             else:
                 self.enemy_score += cleared * 100
                 self.enemy_credits += gain
@@ -280,7 +580,7 @@ class BlockDuelScene(Scene):
                         self._add_garbage(self.player_board, 1)
                         self.enemy_attack_count = 0
                         self.flash_active_e = True
-                        self.flash_timer_e = pygame.time.get_ticks()
+                        self.flash_timer_e = self._frame_ms
 
     # --- Power logic ----------------------------------------------------------
     def _apply_power(self, pid):
@@ -291,9 +591,9 @@ class BlockDuelScene(Scene):
         self.flash_effects[pid] = now
         # In PvP, mirror powers to opponent via net; only apply local effects that target self.
         if self.net_enabled and self.opponent_id:
-            self._net_send_action({"kind": "power", "pid": pid})
+            self._net_send_action({"kind": "power", "pid": pid}, flush=True)
             if pid == P_CLEANSELF:
-                self.player_board = [[None for _ in range(GRID_W)] for _ in range(GRID_H)]
+                clear_board(self.player_board)
             elif pid == P_STEAL_NEXT:
                 self.player_next, self.enemy_next = self.enemy_next, self.player_next
             # Enemy-targeting effects will be applied on the opponent side; skip local enemy mutations.
@@ -327,10 +627,10 @@ class BlockDuelScene(Scene):
                 self.enemy_pos = new_pos
         elif pid == P_CLEANSELF:
             # Only clear non-garbage cells; leave garbage ('X') untouched
-            for y in range(GRID_H):
-                for x in range(GRID_W):
-                    if self.player_board[y][x] is not None and self.player_board[y][x] != "X":
-                        self.player_board[y][x] = None
+            board = self.player_board
+            for i, val in enumerate(board):
+                if val and val != GARBAGE:
+                    board[i] = EMPTY
         elif pid == P_STEAL_NEXT:
             # Swap the next piece between player and enemy (always)
             self.player_next, self.enemy_next = self.enemy_next, self.player_next
@@ -338,6 +638,13 @@ class BlockDuelScene(Scene):
 
     # --- Update ---------------------------------------------------------------
     def update(self, dt):
+        self._remaining = remaining = max(0, MATCH_TIME - (time.monotonic() - self.start_time))
+        # One clock read per frame; update, net handlers and draw all use it.
+        self._frame_ms = pygame.time.get_ticks()
+        self._frame_stale = True
+        # Actions queued since the last frame (piece draws from input or the
+        # previous update) go out now: batching never delays them past a frame.
+        self._net_flush_actions()
         self._net_poll_actions(dt)
         if self.pending_outcome:
             if self.banner.update(dt):
@@ -346,8 +653,6 @@ class BlockDuelScene(Scene):
         if self.match_ended:
             return
 
-        elapsed = time.time() - self.start_time
-        remaining = max(0, MATCH_TIME - elapsed)
         if remaining <= 0 or self.game_over or self.enemy_game_over:
             self._end_match()
             return
@@ -375,59 +680,16 @@ class BlockDuelScene(Scene):
             pass
         elif not self.enemy_game_over:
             base = ENEMY_FALL_SPEED / 1000.0
-            if pygame.time.get_ticks() < self.enemy_boost_until:
+            if self._frame_ms < self.enemy_boost_until:
                 base = base * 0.8
             self.enemy_interval = base
             self.enemy_timer += dt
             if self.enemy_timer >= self.enemy_interval:
                 self.enemy_timer = 0
-                if (
-                    not hasattr(self, "enemy_plan")
-                    or self.enemy_plan.get("shape") != self.enemy_shape
-                ):
-                    best_x, best_rot, best_score = (
-                        self.enemy_pos[0],
-                        self.enemy_rot,
-                        9999,
+                if self.enemy_plan is None or self.enemy_plan["shape"] != self.enemy_shape:
+                    best_x, best_rot = _plan_enemy(
+                        self.enemy_board, self.enemy_shape, self.enemy_pos[0], self.enemy_rot
                     )
-                    for test_rot in range(4):
-                        for test_x in range(-2, GRID_W + 2):
-                            test_pos = [test_x, 0]
-                            while self._valid(
-                                self.enemy_board,
-                                self._cells(self.enemy_shape, test_pos, test_rot),
-                            ):
-                                test_pos[1] += 1
-                            test_pos[1] -= 1
-                            if test_pos[1] < 0:
-                                continue
-                            temp = [row[:] for row in self.enemy_board]
-                            for x, y in self._cells(
-                                self.enemy_shape, test_pos, test_rot
-                            ):
-                                if 0 <= x < GRID_W and 0 <= y < GRID_H:
-                                    temp[y][x] = self.enemy_shape
-                            heights = [0] * GRID_W
-                            holes = 0
-                            for x in range(GRID_W):
-                                block_seen = False
-                                for y in range(GRID_H):
-                                    if temp[y][x]:
-                                        block_seen = True
-                                    elif block_seen:
-                                        holes += 1
-                                for y in range(GRID_H):
-                                    if temp[y][x]:
-                                        heights[x] = GRID_H - y
-                                        break
-                            max_h = max(heights)
-                            bump = sum(
-                                abs(heights[i] - heights[i + 1])
-                                for i in range(GRID_W - 1)
-                            )
-                            score = max_h + holes * 2 + bump * 0.5
-                            if score < best_score:
-                                best_score, best_x, best_rot = score, test_x, test_rot
                     self.enemy_plan = {
                         "shape": self.enemy_shape,
                         "x": best_x,
@@ -472,12 +734,12 @@ class BlockDuelScene(Scene):
                             )
                             self._clear_lines(self.enemy_board, "enemy")
                             self._spawn_enemy()
-                            del self.enemy_plan
+                            self.enemy_plan = None
                     else:
                         plan["rest"] = 0
                         self.enemy_pos = new_pos
 
-        now = pygame.time.get_ticks()
+        now = self._frame_ms
         if self.flash_active_p and now - self.flash_timer_p > 600:
             self.flash_active_p = False
         if self.flash_active_e and now - self.flash_timer_e > 600:
@@ -520,7 +782,7 @@ class BlockDuelScene(Scene):
                     winner = "tie"
         self.final_winner = winner
         outcome = "win" if winner == "player" else "lose" if winner == "enemy" else "tie"
-        elapsed = max(0.0, time.time() - self.start_time)
+        elapsed = max(0.0, time.monotonic() - self.start_time)
         payload = {
             "player_score": self.score,
             "enemy_score": self.enemy_score,
@@ -553,7 +815,8 @@ class BlockDuelScene(Scene):
                         "winner_id": payload.get("winner_id"),
                         "loser_id": payload.get("loser_id"),
                         "reason": reason,
-                    }
+                    },
+                    flush=True,
                 )
             except Exception:
                 pass
@@ -565,6 +828,7 @@ class BlockDuelScene(Scene):
 
     # --- Input ---------------------------------------------------------------
     def handle_event(self, e):
+        self._frame_stale = True
         if self.pending_outcome:
             if e.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
                 self.banner.skip()
@@ -603,15 +867,8 @@ class BlockDuelScene(Scene):
 
         # Keyboard shortcuts for powers: 1-5
         if e.type == pygame.KEYDOWN and not self.match_ended:
-            key_to_pid = {
-                pygame.K_1: P_SPEED_EN,
-                pygame.K_2: P_FORCEDROP,
-                pygame.K_3: P_GARBAGE1,
-                pygame.K_4: P_STEAL_NEXT,
-                pygame.K_5: P_CLEANSELF,
-            }
-            if e.key in key_to_pid:
-                pid = key_to_pid[e.key]
+            pid = KEY_TO_PID.get(e.key)
+            if pid is not None:
                 now = pygame.time.get_ticks()
                 if (
                     self.pending_btn == pid
@@ -632,9 +889,8 @@ class BlockDuelScene(Scene):
             except Exception:
                 scale, ox, oy = 1.0, 0, 0
             bx, by = (mx - ox) / scale, (my - oy) / scale
-            for idx, rect in enumerate(BUTTON_SLOTS):
-                pid = [P_SPEED_EN, P_FORCEDROP, P_GARBAGE1, P_STEAL_NEXT, P_CLEANSELF][idx]
-                if rect.collidepoint(bx, by):
+            for left, top, right, bottom, pid in BUTTON_BOXES:
+                if left <= bx < right and top <= by < bottom:
                     now = pygame.time.get_ticks()
                     if (
                         self.pending_btn == pid
@@ -649,154 +905,211 @@ class BlockDuelScene(Scene):
                     break
 
     # --- Draw ----------------------------------------------------------------
+    def _render(self, font, text, color):
+        """font.render with a small cache; HUD strings rarely change between frames."""
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= TEXT_CACHE_MAX:
+                # Dicts keep insertion order: drop the oldest entry.
+                del self._text_cache[next(iter(self._text_cache))]
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
     def draw(self):
         if (self.w, self.h) != self.manager.size:
             self.w, self.h = self.manager.size
             self.screen = self.manager.screen
-        s = self.screen
-        bg = self.bg
-        if bg.get_size() != (self.w, self.h):
-            bg = pygame.transform.smoothscale(bg, (self.w, self.h))
+        # Without an update/event since the last frame (e.g. under the pause
+        # menu) the composed and scaled frame is reused as-is.
+        if self._frame_stale:
+            self._frame_stale = False
+            ended = bool(self.pending_outcome or self.match_ended)
+            if not (ended and self._base_frozen):
+                self._compose_base()
+                self._scaled_stale = True
+                # Nothing on the boards moves once the match is decided; keep that frame.
+                self._base_frozen = ended
+        self._present()
+
+    def _compose_base(self):
         base = self.base_surf
-        base.blit(self.bg, (0, 0))
-        draw_board(base, self.player_board, origin=(BOARD_X, BOARD_Y), cell_px=CELL)
-        enemy_offset_x = BASE_W - BOARD_X - GRID_W * CELL
-        for r in range(GRID_H):
-            for c in range(GRID_W):
-                val = self.enemy_board[r][c]
-                if val:
-                    x = enemy_offset_x + c * CELL
-                    y = BOARD_Y + r * CELL
-                    pygame.draw.rect(
-                        base,
-                        COLORS.get(val, (200, 200, 200)),
-                        (x + 1, y + 1, CELL - 2, CELL - 2),
-                    )
-        draw_dispenser(base, self.shared_queue, center_x=BASE_W // 2, scale=1.0)
-        draw_next_slots(base, self.player_next, self.enemy_next, center_x=BASE_W // 2, scale=1.0)
-
-        for shape, pos, rot, col, offx in [
-            (self.shape, self.pos, self.rot, COLORS.get(self.shape), BOARD_X),
-            (
-                self.enemy_shape,
-                self.enemy_pos,
-                self.enemy_rot,
-                COLORS.get(self.enemy_shape),
-                enemy_offset_x,
-            ),
+        bg = self.bg
+        prev = self._dirty_rects
+        if prev is None or self.pending_outcome:
+            base.blit(bg, (0, 0))
+        else:
+            for r in prev:
+                base.blit(bg, r, r)
+        dirty = list(self._static_dirty)
+        tiles = self.cell_tiles
+        draw_board(base, self.player_board, origin=(BOARD_X, BOARD_Y), cell_px=CELL, tiles=tiles)
+        enemy_offset_x = ENEMY_BOARD_X
+        draw_board(base, self.enemy_board, origin=(enemy_offset_x, BOARD_Y), cell_px=CELL, tiles=tiles)
+        chute_key = (tuple(islice(self.shared_queue, 4)), self.player_next, self.enemy_next)
+        if chute_key != self._chute_key:
+            self._chute_key = chute_key
+            chute = self._chute_surf
+            chute.fill((0, 0, 0, 0))
+            cr = self._chute_rect
+            draw_dispenser(chute, self.shared_queue, center_x=BASE_W // 2 - cr.x, scale=1.0, top=cr.y)
+            draw_next_slots(chute, self.player_next, self.enemy_next, center_x=BASE_W // 2 - cr.x, scale=1.0, top=cr.y)
+        base.blit(self._chute_surf, self._chute_rect)
+
+        piece_blits = []
+        for shape, pos, rot, offx in [
+            (self.shape, self.pos, self.rot, BOARD_X),
+            (self.enemy_shape, self.enemy_pos, self.enemy_rot, enemy_offset_x),
         ]:
+            tile = tiles[SHAPE_ID[shape]]
             for x, y in self._cells(shape, pos, rot):
                 if 0 <= x < GRID_W and 0 <= y < GRID_H:
-                    px = offx + x * CELL
-                    py = BOARD_Y + y * CELL
-                    pygame.draw.rect(base, col, (px + 1, py + 1, CELL - 2, CELL - 2))
+                    piece_blits.append((tile, (offx + x * CELL + 1, BOARD_Y + y * CELL + 1)))
+        base.blits(piece_blits, False)
 
         # timer
-        elapsed = time.time() - self.start_time
-        remaining = max(0, MATCH_TIME - elapsed)
+        remaining = self._remaining
         mins, secs = int(remaining // 60), int(remaining % 60)
-        timer_text = self.font_big.render(f"{mins:02}:{secs:02}", True, (255, 255, 255))
-        base.blit(timer_text, (BASE_W // 2 - timer_text.get_width() // 2, 420))
+        timer_text = self._render(self.font_big, f"{mins:02}:{secs:02}", (255, 255, 255))
+        dirty.append(base.blit(timer_text, (BASE_W // 2 - timer_text.get_width() // 2, 420)))
 
         # credits + score
-        base.blit(
-            self.font.render(f"Score: {self.score}", True, (255, 255, 255)),
+        dirty.append(base.blit(
+            self._render(self.font, f"Score: {self.score}", (255, 255, 255)),
             (BOARD_X + 60, BOARD_Y - 44),
-        )
-        base.blit(
-            self.font.render(f"Score: {self.enemy_score}", True, (255, 100, 100)),
+        ))
+        dirty.append(base.blit(
+            self._render(self.font, f"Score: {self.enemy_score}", (255, 100, 100)),
             (enemy_offset_x + 50, BOARD_Y - 44),
-        )
-        base.blit(
-            self.font_big.render(f"{self.credits}¢", True, (255, 255, 0)),
+        ))
+        dirty.append(base.blit(
+            self._render(self.font_big, f"{self.credits}¢", (255, 255, 0)),
             (BOARD_X + GRID_W * CELL + 70, BOARD_Y + GRID_H * CELL - 40),
-        )
-        base.blit(
-            self.font_big.render(f"{self.enemy_credits}¢", True, (255, 100, 100)),
+        ))
+        dirty.append(base.blit(
+            self._render(self.font_big, f"{self.enemy_credits}¢", (255, 100, 100)),
             (enemy_offset_x - 110, BOARD_Y + GRID_H * CELL - 40),
-        )
+        ))
 
         # power labels
-        now = pygame.time.get_ticks()
-        for idx, rect in enumerate(BUTTON_SLOTS):
-            pid = [P_SPEED_EN, P_FORCEDROP, P_GARBAGE1, P_STEAL_NEXT, P_CLEANSELF][idx]
-            armed = (
-                self.pending_btn == pid
-                and now - self.pending_started <= CONFIRM_WINDOW_MS
-            )
-            flashing = (
-                pid in self.flash_effects
-                and now - self.flash_effects[pid] < FLASH_DURATION_MS
-            )
-            color = (255, 255, 255)
-            if armed:
-                color = (255, 255, 120)
-            if flashing:
-                pulse = 255 - int(
-                    (now - self.flash_effects[pid]) / FLASH_DURATION_MS * 255
-                )
-                color = (255, pulse, pulse)
-
-            text1 = self.font_small.render(POWER_LABEL[pid], True, color)
-            text2 = self.font_small.render(f"{POWER_COST[pid]}¢", True, (255, 255, 0))
-            base.blit(text1, (rect.centerx - text1.get_width() // 2 - 6, rect.y))
-            base.blit(text2, (rect.centerx - text2.get_width() // 2 - 6, rect.y + 20))
+        now = self._frame_ms
+        pending_armed = self.pending_btn if now - self.pending_started <= CONFIRM_WINDOW_MS else None
+        flash_effects = self.flash_effects
+        for rect, pid, label, armed_label, flash, label_pos, cost, cost_pos in self._power_hud:
+            text1 = armed_label if pid == pending_armed else label
+            flash_at = flash_effects.get(pid)
+            if flash_at is not None and 0 <= now - flash_at < FLASH_DURATION_MS:
+                text1 = flash[(now - flash_at) * FLASH_STEPS // FLASH_DURATION_MS]
+            dirty.append(base.blit(text1, label_pos))
+            dirty.append(base.blit(cost, cost_pos))
 
         # --- 2-tally indicators ---
-        p_base_x = BOARD_X + GRID_W * CELL + 100
-        p_base_y = BOARD_Y + GRID_H * CELL - 100
-        for i in range(2):
-            filled = i < (self.attack_count % 2)
-            color = (255, 255, 0) if filled else (80, 80, 80)
+        dots = self._tally_dots
+        dot_blits = []
+        filled = self.attack_count % 2
+        for i, pos in enumerate(P_TALLY_POS):
+            color = (255, 255, 0) if i < filled else (80, 80, 80)
             if self.flash_active_p:
                 color = (255, 255, 255)
-            pygame.draw.circle(base, color, (p_base_x + i * 24, p_base_y), 8)
+            dot_blits.append((dots[color], pos))
 
-        e_base_x = enemy_offset_x - 120
-        e_base_y = BOARD_Y + GRID_H * CELL - 100
-        for i in range(2):
-            filled = i < (self.enemy_attack_count % 2)
-            color = (255, 100, 100) if filled else (80, 80, 80)
+        filled = self.enemy_attack_count % 2
+        for i, pos in enumerate(E_TALLY_POS):
+            color = (255, 100, 100) if i < filled else (80, 80, 80)
             if self.flash_active_e:
                 color = (255, 255, 255)
-            pygame.draw.circle(base, color, (e_base_x + i * 24, e_base_y), 8)
+            dot_blits.append((dots[color], pos))
+        dirty.extend(base.blits(dot_blits))
 
         if self.pending_outcome:
             self.banner.draw(base, self.font_big, self.font_small, (BASE_W, BASE_H))
+            dirty = None
+        self._dirty_rects = dirty
 
+    def _ensure_present_buffers(self, size):
+        """Recompute fit geometry and (re)allocate the scaled buffer for a new window size."""
+        self._present_size = size
+        w, h = size
         # scale base surface to screen while preserving aspect ratio
-        scale = min(self.w / BASE_W, self.h / BASE_H) if self.w and self.h else 1.0
+        scale = min(w / BASE_W, h / BASE_H) if w and h else 1.0
         scaled_size = (int(BASE_W * scale), int(BASE_H * scale))
-        blit_surf = pygame.transform.smoothscale(base, scaled_size)
-        ox = (self.w - scaled_size[0]) // 2
-        oy = (self.h - scaled_size[1]) // 2
         self._blit_scale = scale
-        self._blit_offset = (ox, oy)
-        self.screen.blit(blit_surf, (ox, oy))
+        self._blit_offset = ((w - scaled_size[0]) // 2, (h - scaled_size[1]) // 2)
+        if scaled_size == (BASE_W, BASE_H):
+            self._scaled_buf = None
+        elif self._scaled_buf is None or self._scaled_size != scaled_size:
+            self._scaled_buf = pygame.Surface(scaled_size).convert()
+        self._scaled_size = scaled_size
+
+    def _present(self):
+        if (self.w, self.h) != self._present_size:
+            self._ensure_present_buffers((self.w, self.h))
+            self._scaled_stale = True
+        buf = self._scaled_buf
+        if buf is None:
+            # Window matches the base resolution: no scaling pass at all.
+            self.screen.blit(self.base_surf, self._blit_offset)
+            return
+        if self._scaled_stale:
+            self._scaled_stale = False
+            # Nearest-neighbour into the reused buffer; only downscaling needs smoothing.
+            if self._blit_scale < 1.0:
+                pygame.transform.smoothscale(self.base_surf, self._scaled_size, buf)
+            else:
+                pygame.transform.scale(self.base_surf, self._scaled_size, buf)
+        self.screen.blit(buf, self._blit_offset)
 
     def _pause_game(self):
-        try:
-            from pause_menu import PauseMenuScene
-        except Exception as exc:
-            print(f"[BlockDuel] Pause menu unavailable: {exc}")
+        global _PauseMenuScene, _pause_import_tried
+        if not _pause_import_tried:
+            _pause_import_tried = True
+            try:
+                from pause_menu import PauseMenuScene as _PauseMenuScene
+            except Exception as exc:
+                print(f"[BlockDuel] Pause menu unavailable: {exc}")
+        if _PauseMenuScene is None:
             return
         if self.context is None:
             self.context = GameContext()
-        self.manager.push(PauseMenuScene(self.manager, self.context, self))
+        self.manager.push(_PauseMenuScene(self.manager, self.context, self))
 
     # --------- Net helpers ----------
     def _pack_board(self, board):
-        return ["".join(cell if cell else "." for cell in row) for row in board]
-
-    def _unpack_board(self, packed):
-        board = []
-        for row in packed or []:
-            board.append([ch if ch != "." else None for ch in row])
+        # Wire format stays one string per row: shape letter, "X" garbage, "." empty.
+        text = board.translate(_PACK_TABLE).decode("ascii")
+        return [text[i:i + GRID_W] for i in range(0, GRID_W * GRID_H, GRID_W)]
+
+    def _unpack_board(self, packed, board=None):
+        """Decode wire rows into ``board`` (cleared in place) or a fresh board."""
+        if board is None:
+            board = new_board()
+        else:
+            clear_board(board)
+        for r, row in enumerate((packed or [])[:GRID_H]):
+            self._unpack_row(board, r, row)
         return board
 
-    def _net_send_action(self, action: dict):
+    def _unpack_row(self, board, r, row):
+        start = r * GRID_W
+        data = row[:GRID_W].ljust(GRID_W, ".").encode("ascii", "replace").translate(_UNPACK_TABLE)
+        board[start:start + GRID_W] = data
+
+    def _net_send_action(self, action: dict, flush=False):
+        """Queue an action for the opponent; queued actions go out together on
+        flush, which happens at latest at the start of the next update()."""
         if not self.net_enabled or not self.net_client or not action:
             return
+        self._pending_net_actions.append(action)
+        if flush or len(self._pending_net_actions) >= NET_BATCH_MAX:
+            self._net_flush_actions()
+
+    def _net_flush_actions(self):
+        pending = self._pending_net_actions
+        if not pending or not self.net_client:
+            return
+        self._pending_net_actions = []
+        action = pending[0] if len(pending) == 1 else {"kind": "batch", "actions": pending}
         try:
             self.net_client.send_duel_action({"duel_id": self.duel_id, "action": action})
         except Exception as exc:
@@ -805,9 +1118,19 @@ class BlockDuelScene(Scene):
     def _net_send_state(self, force=False):
         if not self.net_enabled or not self.net_client:
             return
+        rows = self._pack_board(self.player_board)
+        meta = (
+            self.shape, tuple(self.pos), int(self.rot), self.player_next,
+            self.game_over, self.score, self.credits, self.attack_count,
+        )
+        last = self._last_sent_rows
+        full_due = force or last is None or self._net_sends_since_full >= NET_FULL_EVERY
+        if not full_due and rows == last and meta == self._last_sent_meta:
+            self._net_flush_actions()
+            return
         state = {
             "kind": "state",
-            "board": self._pack_board(self.player_board),
+            "proto": NET_PROTOCOL,
             "shape": self.shape,
             "pos": list(self.pos),
             "rot": int(self.rot),
@@ -817,100 +1140,204 @@ class BlockDuelScene(Scene):
             "credits": self.credits,
             "attack_count": self.attack_count,
         }
+        changed = None if full_due else [[r, row] for r, (old, row) in enumerate(zip(last, rows)) if old != row]
+        if changed is None or len(changed) > GRID_H // 2:
+            state["board"] = rows
+            self._net_sends_since_full = 0
+        else:
+            if changed:
+                state["board_delta"] = changed
+            self._net_sends_since_full += 1
+        self._last_sent_rows = rows
+        self._last_sent_meta = meta
         if force:
             state["force"] = True
-        self._net_send_action(state)
+        self._net_send_action(state, flush=True)
 
     def _net_poll_actions(self, dt: float):
         if not self.net_enabled or not self.net_client:
             return
-        while True:
-            msg = self.net_client.pop_duel_action(self.duel_id)
+        # Pull a bounded batch first so a burst can't stall the frame, then dispatch.
+        pop = self.net_client.pop_duel_action
+        msgs = []
+        for _ in range(NET_POLL_MAX):
+            msg = pop(self.duel_id)
             if not msg:
                 break
+            msgs.append(msg)
+        actions = []
+        for msg in msgs:
             sender = msg.get("from")
             if sender and sender == self.local_id:
                 continue
             action = msg.get("action") or {}
-            kind = action.get("kind")
-            if kind == "state":
-                self._net_apply_state(action)
-            elif kind == "power":
-                self._net_apply_power_from_opponent(action.get("pid"))
-            elif kind == "outcome":
-                self._net_apply_outcome(action, sender)
-            elif kind == "draw":
-                if action.get("duel_id") and self.duel_id and action["duel_id"] != self.duel_id:
-                    continue
-                piece = action.get("piece")
-                if not piece:
-                    continue
-                # Pop and append a new shape so both queues stay aligned.
-                if not self.shared_queue:
-                    self.shared_queue = [self._new_shape() for _ in range(6)]
-                expected = self.shared_queue.pop(0)
-                self.shared_queue.append(self._new_shape())
-                if expected != piece:
-                    # Realign by inserting the received piece at the front if out of sync.
-                    self.shared_queue.insert(0, piece)
-
-    def _net_apply_state(self, action: dict):
+            if action.get("kind") == "batch":
+                actions.extend((sub or {}, sender) for sub in action.get("actions") or ())
+            else:
+                actions.append((action, sender))
+        # Back-to-back states from one sender collapse into a single apply;
+        # powers, draws and outcomes keep their order around them.
+        run = []
+        for action, sender in actions:
+            if action.get("kind") == "state" and (not run or run[-1][1] == sender):
+                run.append((action, sender))
+                continue
+            if run:
+                self._net_handle_action(self._merge_states(run), run[0][1])
+                run = []
+            if action.get("kind") == "state":
+                run.append((action, sender))
+            else:
+                self._net_handle_action(action, sender)
+        if run:
+            self._net_handle_action(self._merge_states(run), run[0][1])
+
+    def _merge_states(self, run):
+        """Fold consecutive state messages into one: latest fields, combined board rows."""
+        if len(run) == 1:
+            return run[0][0]
+        merged = dict(run[-1][0])
+        merged.pop("board", None)
+        merged.pop("board_delta", None)
+        board = None
+        rows = {}
+        for action, _sender in run:
+            if action.get("force"):
+                merged["force"] = True
+            if action.get("board"):
+                board = list(action["board"])
+                rows.clear()
+            for r, row in action.get("board_delta") or ():
+                rows[r] = row
+        if board is not None:
+            for r, row in rows.items():
+                if 0 <= r < len(board):
+                    board[r] = row
+            merged["board"] = board
+        elif rows:
+            merged["board_delta"] = [[r, row] for r, row in rows.items()]
+        return merged
+
+    def _net_handle_action(self, action: dict, sender):
+        handler = self._net_handlers.get(action.get("kind"))
+        if handler:
+            handler(action, sender)
+
+    def _net_apply_draw(self, action: dict, sender=None):
+        if action.get("duel_id") and self.duel_id and action["duel_id"] != self.duel_id:
+            return
+        piece = action.get("piece")
+        if not piece:
+            return
+        # Pop and append a new shape so both queues stay aligned.
+        if not self.shared_queue:
+            self.shared_queue.extend(self._new_shapes(6))
+        expected = self.shared_queue.popleft()
+        self.shared_queue.append(self._new_shape())
+        if expected != piece:
+            # Realign by inserting the received piece at the front if out of sync.
+            self.shared_queue.appendleft(piece)
+
+    def _net_apply_state(self, action: dict, sender=None):
+        if action.get("proto") != NET_PROTOCOL:
+            self._net_protocol_mismatch(action.get("proto"))
+            return
         # Incoming opponent state drives enemy board visuals.
         self.enemy_ready = True
         self.battle_started = True
         packed = action.get("board")
+        board = self.enemy_board
         if packed:
-            self.enemy_board = self._unpack_board(packed)
-        self.enemy_shape = action.get("shape", self.enemy_shape)
-        self.enemy_pos = list(action.get("pos", self.enemy_pos))
-        self.enemy_rot = int(action.get("rot", self.enemy_rot))
-        self.enemy_next = action.get("next", self.enemy_next)
-        self.enemy_game_over = bool(action.get("game_over", False))
-        self.enemy_score = int(action.get("score", self.enemy_score))
-        self.enemy_credits = int(action.get("credits", self.enemy_credits))
-        self.enemy_attack_count = int(action.get("attack_count", self.enemy_attack_count))
+            # Repeated snapshots are common (keyframes, resends); skip the decode
+            # unless the rows differ or the board was touched locally since.
+            if packed != self._last_enemy_packed or board != self._enemy_board_seen:
+                self._unpack_board(packed, board)
+                self._last_enemy_packed = packed
+                self._enemy_board_seen = bytes(board)
+        else:
+            delta = action.get("board_delta")
+            if delta:
+                for r, row in delta:
+                    if 0 <= r < GRID_H:
+                        self._unpack_row(board, r, row)
+                self._last_enemy_packed = None
+        get = action.get
+        self.enemy_shape = get("shape", self.enemy_shape)
+        pos = get("pos")
+        if pos is not None and pos != self.enemy_pos:
+            self.enemy_pos = list(pos)
+        self.enemy_next = get("next", self.enemy_next)
+        self.enemy_game_over = bool(get("game_over", False))
+        # JSON already delivers ints; only coerce anything else.
+        val = get("rot")
+        if val is not None:
+            self.enemy_rot = val if type(val) is int else int(val)
+        val = get("score")
+        if val is not None:
+            self.enemy_score = val if type(val) is int else int(val)
+        val = get("credits")
+        if val is not None:
+            self.enemy_credits = val if type(val) is int else int(val)
+        val = get("attack_count")
+        if val is not None:
+            self.enemy_attack_count = val if type(val) is int else int(val)
         # If opponent reports game over, trigger end-match resolution.
         if self.enemy_game_over and not self.match_ended and not self.pending_outcome:
             self._end_match()
 
-    def _net_apply_power_from_opponent(self, pid):
-        if not pid:
+    def _net_protocol_mismatch(self, proto):
+        """Opponent speaks another wire format: end the duel without a winner."""
+        if self.pending_outcome or self.match_ended:
             return
-        now = pygame.time.get_ticks()
+        print(f"[BlockDuel] Opponent protocol {proto!r} does not match {NET_PROTOCOL}; ending duel")
+        self.match_ended = True
+        self.pending_payload = {"reason": "version_mismatch"}
+        self.pending_outcome = "draw"
+        self.banner.show("draw", title="Version Mismatch", subtitle="Update both games to duel")
+
+    def _net_apply_power(self, action: dict, sender=None):
         # Apply as if the opponent targeted us.
-        if pid == P_GARBAGE1:
-            self._add_garbage(self.player_board, 1)
-        elif pid == P_SPEED_EN:
-            # Speed up our fall rate (penalty).
-            self.drop_interval = max(0.05, (FALL_SPEED / 1000.0) * 0.75)
-            self.enemy_boost_until = now + 3000
-        elif pid == P_FORCEDROP:
-            while True:
-                new_pos = self._move(
+        handler = self._opponent_powers.get(action.get("pid"))
+        if handler:
+            handler()
+
+    def _opp_garbage(self):
+        self._add_garbage(self.player_board, 1)
+
+    def _opp_speed(self):
+        # Speed up our fall rate (penalty).
+        self.drop_interval = max(0.05, (FALL_SPEED / 1000.0) * 0.75)
+        self.enemy_boost_until = self._frame_ms + 3000
+
+    def _opp_forcedrop(self):
+        while True:
+            new_pos = self._move(
+                self.player_board,
+                self.shape,
+                self.pos,
+                self.rot,
+                0,
+                1,
+            )
+            if new_pos == self.pos:
+                self._lock(
                     self.player_board,
                     self.shape,
                     self.pos,
                     self.rot,
-                    0,
-                    1,
                 )
-                if new_pos == self.pos:
-                    self._lock(
-                        self.player_board,
-                        self.shape,
-                        self.pos,
-                        self.rot,
-                    )
-                    self._clear_lines(self.player_board, "player")
-                    self._spawn_player()
-                    break
-                self.pos = new_pos
-        elif pid == P_STEAL_NEXT:
-            # Swap next pieces.
-            self.player_next, self.enemy_next = self.enemy_next, self.player_next
-        elif pid == P_CLEANSELF:
-            # Clean our own board (opponent used self-clean)
-            self.player_board = [[None for _ in range(GRID_W)] for _ in range(GRID_H)]
+                self._clear_lines(self.player_board, "player")
+                self._spawn_player()
+                break
+            self.pos = new_pos
+
+    def _opp_steal_next(self):
+        # Swap next pieces.
+        self.player_next, self.enemy_next = self.enemy_next, self.player_next
+
+    def _opp_cleanself(self):
+        # Clean our own board (opponent used self-clean)
+        clear_board(self.player_board)
 
     def _net_apply_outcome(self, action: dict, sender=None):
         if self.pending_outcome or self.match_ended:
@@ -920,23 +1347,11 @@ class BlockDuelScene(Scene):
             return
         # Use opponent-provided scores if present (swap to our perspective).
         if sender and sender == self.opponent_id:
-            if "player_score" in action:
-                val = action.get("player_score")
-                if val is not None:
-                    self.enemy_score = int(val)
-            if "enemy_score" in action:
-                val = action.get("enemy_score")
-                if val is not None:
-                    self.score = int(val)
+            self.enemy_score = _get_int(action, "player_score", self.enemy_score)
+            self.score = _get_int(action, "enemy_score", self.score)
         else:
-            if "player_score" in action:
-                val = action.get("player_score")
-                if val is not None:
-                    self.score = int(val)
-            if "enemy_score" in action:
-                val = action.get("enemy_score")
-                if val is not None:
-                    self.enemy_score = int(val)
+            self.score = _get_int(action, "player_score", self.score)
+            self.enemy_score = _get_int(action, "enemy_score", self.enemy_score)
 
         outcome = action.get("outcome")
         if sender and sender == self.opponent_id:
@@ -981,6 +1396,7 @@ class BlockDuelScene(Scene):
         if self._completed:
             return
         self._completed = True
+        self._net_flush_actions()
         self.pending_outcome = None
         if self.context is None:
             self.context = GameContext()
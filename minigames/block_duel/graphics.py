@@ -1,4 +1,5 @@
 import pygame
+from itertools import islice
 from pathlib import Path
 from resource_path import resource_path
 
@@ -29,61 +30,110 @@ SHAPES = {
     "L": [(2, 0), (0, 1), (1, 1), (2, 1)],
 }
 
+# Boards are flat bytearrays (row-major, GRID_W per row): 0 = empty,
+# 1..7 = shape id (SHAPES order), GARBAGE = garbage row filler.
+EMPTY = 0
+GARBAGE = 8
+SHAPE_ID = {name: i + 1 for i, name in enumerate(SHAPES)}
+ID_SHAPE = {i: name for name, i in SHAPE_ID.items()}
+CELL_COLORS = [None] + [COLORS[name] for name in SHAPES] + [(200, 200, 200)]
+
+
+_BLANK_BOARD = bytes(GRID_W * GRID_H)
+
+
+def new_board():
+    return bytearray(_BLANK_BOARD)
+
+
+def clear_board(board):
+    """Empty ``board`` in place (no new buffer)."""
+    board[:] = _BLANK_BOARD
+
 
 def load_background():
     return pygame.image.load(str(BACKGROUND)).convert()
 
 
-def draw_board(surface, board, origin=None, cell_px: int = CELL):
-    """Draw a grid at the given origin using the provided cell size."""
+def make_cell_tiles(cell_px: int = CELL):
+    """Pre-filled block tiles indexed by board cell value (index 0 unused)."""
+    tiles = [None]
+    for color in CELL_COLORS[1:]:
+        tile = pygame.Surface((cell_px - 2, cell_px - 2)).convert()
+        tile.fill(color)
+        tiles.append(tile)
+    return tiles
+
+
+_TILE_CACHE = {}
+_CELL_POSITIONS = {}
+
+
+def draw_board(surface, board, origin=None, cell_px: int = CELL, tiles=None):
+    """Draw a grid at the given origin using the provided cell size.
+
+    All blocks go out in one batched blit of pre-filled tiles (``tiles`` from
+    make_cell_tiles, or a cached set for ``cell_px``).
+    """
     ox, oy = origin if origin else (BOARD_X, BOARD_Y)
-    for r in range(GRID_H):
-        for c in range(GRID_W):
-            val = board[r][c]
-            if val:
-                x = ox + c * cell_px
-                y = oy + r * cell_px
-                pygame.draw.rect(
-                    surface,
-                    COLORS.get(val, (200, 200, 200)),
-                    (x + 1, y + 1, cell_px - 2, cell_px - 2),
-                )
-
-
-def draw_dispenser(surface, queue, center_x: int, scale: float = 1.0):
-    """Draw 4 upcoming shared pieces floating over center dispenser."""
+    if not tiles:
+        tiles = _TILE_CACHE.get(cell_px)
+        if tiles is None:
+            tiles = _TILE_CACHE[cell_px] = make_cell_tiles(cell_px)
+    key = (ox, oy, cell_px)
+    positions = _CELL_POSITIONS.get(key)
+    if positions is None:
+        positions = _CELL_POSITIONS[key] = tuple(
+            (ox + c * cell_px + 1, oy + r * cell_px + 1) for r in range(GRID_H) for c in range(GRID_W)
+        )
+    surface.blits([(tiles[val], pos) for val, pos in zip(board, positions) if val], False)
+
+
+_PIECE_SPRITES = {}
+
+
+def _piece_sprite(shape, block_px: int):
+    """Whole-piece preview sprite, rendered once per (shape, block size)."""
+    key = (shape, block_px)
+    sprite = _PIECE_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((4 * block_px, 3 * block_px), pygame.SRCALPHA)
+        col = COLORS.get(shape, (255, 255, 255))
+        for dx, dy in SHAPES[shape]:
+            sprite.fill(col, (dx * block_px, dy * block_px, block_px, block_px))
+        _PIECE_SPRITES[key] = sprite
+    return sprite
+
+
+def draw_dispenser(surface, queue, center_x: int, scale: float = 1.0, top: int = 0):
+    """Draw 4 upcoming shared pieces floating over center dispenser.
+
+    ``top`` is the screen y that maps to row 0 of ``surface`` (for drawing into
+    a cached panel rather than the full frame).
+    """
     box_w = int(46 * scale)
     box_h = int(42 * scale)
     gap = max(6, int(8 * scale))
     start_x = center_x - box_w // 2 - 2
-    start_y = int(128 * scale)
+    start_y = int(128 * scale) - top
+    block_px = int(12 * scale)
 
-    for i, shape in enumerate(queue[:4]):
-        bx = start_x
-        by = start_y + i * (box_h + gap)
-        col = COLORS.get(shape, (255, 255, 255))
-        for dx, dy in SHAPES[shape]:
-            px = bx + 4 + dx * int(12 * scale)
-            py = by + 4 + dy * int(12 * scale)
-            pygame.draw.rect(surface, col, (px, py, int(12 * scale), int(12 * scale)))
+    surface.blits(
+        [
+            (_piece_sprite(shape, block_px), (start_x + 4, start_y + i * (box_h + gap) + 4))
+            for i, shape in enumerate(islice(queue, 4))
+        ],
+        False,
+    )
 
 
-def draw_next_slots(surface, player_next, enemy_next, center_x: int, scale: float = 1.0):
+def draw_next_slots(surface, player_next, enemy_next, center_x: int, scale: float = 1.0, top: int = 0):
     """Draw player (blue) and enemy (red) next pieces in the T side boxes."""
-    player_x = center_x - int(48 * scale) - int(40 * scale)
-    player_y = int(120 * scale)
+    block_px = int(12 * scale)
+    y = int(120 * scale) - top + 4
     if player_next:
-        col = COLORS.get(player_next, (255, 255, 255))
-        for dx, dy in SHAPES[player_next]:
-            px = player_x + 4 + dx * int(12 * scale)
-            py = player_y + 4 + dy * int(12 * scale)
-            pygame.draw.rect(surface, col, (px, py, int(12 * scale), int(12 * scale)))
-
-    enemy_x = center_x + int(48 * scale) - 4
-    enemy_y = int(120 * scale)
+        player_x = center_x - int(48 * scale) - int(40 * scale)
+        surface.blit(_piece_sprite(player_next, block_px), (player_x + 4, y))
     if enemy_next:
-        col = COLORS.get(enemy_next, (255, 255, 255))
-        for dx, dy in SHAPES[enemy_next]:
-            px = enemy_x + 4 + dx * int(12 * scale)
-            py = enemy_y + 4 + dy * int(12 * scale)
-            pygame.draw.rect(surface, col, (px, py, int(12 * scale), int(12 * scale)))
+        enemy_x = center_x + int(48 * scale) - 4
+        surface.blit(_piece_sprite(enemy_next, block_px), (enemy_x + 4, y))
@@ -8,6 +8,7 @@
 #  • Keeps: 1s silent pause after each roll, history ribbons, enlarged die, end banner
 
 import pygame, random
+from collections import deque
 from pathlib import Path
 from scene_manager import Scene
 from content_registry import load_game_fonts
@@ -54,6 +55,11 @@ S_IDX = {
 TRACK_STOPS = 22  # 0..21
 TRACK_X0, TRACK_STEP = 64, 24
 TRACK_Y_P1, TRACK_Y_P2 = 230, 270
+BEAD_X = tuple(TRACK_X0 + t * TRACK_STEP for t in range(TRACK_STOPS))  # bead x per stop
+
+NET_POLL_MAX = 32  # inbound messages folded per frame; the rest wait for the next one
+# Net state kinds that carry the dice history
+NET_HIST_KINDS = ("init", "roll", "finish")
 
 # Other timings
 NPC_THINK_MS = (260, 420)
@@ -70,8 +76,27 @@ RIB_BL_Y = 312  # Player 2 ribbon (bottom-left)
 RIB_BL_LEFT_MARGIN = 40  # distance from left edge
 
 
+def _pip_offsets(val):
+    """Scattered pip positions for the vector die (stable per face value)."""
+    rng = random.Random(1234 + val)
+    return tuple((rng.randint(-8, 8), rng.randint(-8, 8)) for _ in range(val))
+
+
+PIP_OFFSETS = {val: _pip_offsets(val) for val in range(1, 7)}
+
+
 # ---------- robust asset lookup ----------
+_FILE_CACHE: dict[str, Path | None] = {}  # resolved once per process (scene restarts reuse it)
+
+
 def _find_file(filename: str) -> Path | None:
+    if filename in _FILE_CACHE:
+        return _FILE_CACHE[filename]
+    _FILE_CACHE[filename] = found = _search_file(filename)
+    return found
+
+
+def _search_file(filename: str) -> Path | None:
     here = Path(__file__).resolve()
     candidates = [
         Path(resource_path("minigames", "bones_21", filename)),
@@ -98,14 +123,29 @@ def _try_load(path: Path | None):
 class _Sheet:
     def __init__(self, surf, fw, fh, cols):
         self.surf, self.fw, self.fh, self.cols = surf, fw, fh, cols
+        # Frames are sliced (and optionally scaled) once, then reused every draw.
+        self._frames = {}
+        if surf:
+            for idx in (*FACE_IDX.values(), *S_IDX.values()):
+                self.frame(idx)
 
-    def frame(self, idx):
+    def frame(self, idx, size=None):
         if not self.surf:
             return None
-        c, r = idx % self.cols, idx // self.cols
-        rect = pygame.Rect(c * self.fw, r * self.fh, self.fw, self.fh)
-        sub = pygame.Surface((self.fw, self.fh), pygame.SRCALPHA)
-        sub.blit(self.surf, (0, 0), rect)
+        key = (idx, size)
+        sub = self._frames.get(key)
+        if sub is not None:
+            return sub
+        if size is None:
+            c, r = idx % self.cols, idx // self.cols
+            rect = pygame.Rect(c * self.fw, r * self.fh, self.fw, self.fh)
+            sub = pygame.Surface((self.fw, self.fh), pygame.SRCALPHA)
+            sub.blit(self.surf, (0, 0), rect)
+            # Match the display pixel format so per-frame blits skip conversion.
+            sub = sub.convert_alpha()
+        else:
+            sub = pygame.transform.scale(self.frame(idx), size)
+        self._frames[key] = sub
         return sub
 
 
@@ -119,11 +159,30 @@ class Bones21Scene(Scene):
         self.callback = callback
         self.big, self.font, self.small = load_game_fonts()
         self.minigame_id = "bones_21"
+        self._text_cache = {}
+        self._title_surf = self.big.render(TITLE, True, (245, 235, 160))
+        # Static track badges '1' and '2'.
+        self._badges = []
+        for label, col in (("1", (255, 230, 160)), ("2", (180, 220, 255))):
+            badge = pygame.Surface((20, 20), pygame.SRCALPHA)
+            pygame.draw.rect(badge, (24, 28, 40), (0, 0, 20, 20), border_radius=6)
+            pygame.draw.rect(badge, (80, 90, 120), (0, 0, 20, 20), 2, border_radius=6)
+            txt = self.small.render(label, True, col)
+            badge.blit(txt, (10 - txt.get_width() // 2, 10 - txt.get_height() // 2))
+            self._badges.append(badge)
 
         self.w, self.h = manager.size
         self.screen = manager.screen
-        self.view = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
+        self.view = pygame.Surface((self.w, self.h), pygame.SRCALPHA).convert_alpha()
         self.bg_pos = (0, 0)
+        self._track_blit_cache = {}
+        self._static_bg = None
+        self._static_size = None
+        self._view_key = None  # state the current self.view was drawn from
+        # Screen-side partial present: does the screen hold self.view, and what
+        # changed in it last frame (None -> next present is a full copy).
+        self._screen_synced = False
+        self._prev_dirty = None
 
         # assets
         bg_path = kwargs.get("bg_path")
@@ -137,6 +196,20 @@ class Bones21Scene(Scene):
             self._asset_note.append("NO background.png (vector fallback)")
         if not self.sheet.surf:
             self._asset_note.append("NO spritesheet.png (vector fallback)")
+        # History ribbon tiles per face, pre-scaled to HIST_TILE, and the bead
+        # frame per (player, squashed-on-a-5-stop).
+        self._hist_tiles = {}
+        self._bead_frames = {}
+        if self.sheet.surf:
+            self._bead_frames = {
+                (0, False): self.sheet.frame(S_IDX["bead_p1"]),
+                (0, True): self.sheet.frame(S_IDX["bead_p1sq"]),
+                (1, False): self.sheet.frame(S_IDX["bead_p2"]),
+                (1, True): self.sheet.frame(S_IDX["bead_p2sq"]),
+            }
+            self._hist_tiles = {
+                face: self.sheet.frame(idx, (HIST_TILE, HIST_TILE)) for face, idx in FACE_IDX.items()
+            }
         print("[Bones21] background:", bg_file)
         print("[Bones21] spritesheet:", sheet_file)
 
@@ -172,8 +245,10 @@ class Bones21Scene(Scene):
         self.rolls_done = 0
         # Spinner state (no settle logic)
         self.rolling = False  # spinner running
-        self.roll_acc = 0.0  # accumulator for spinner ticks (ms)
-        self.spinner_face = 1  # current visible face while spinning
+        self.spinner_face = 1  # visible face while spinning (advanced lazily in draw)
+        # Spinner anchor: face = start face advanced one step per SPINNER_FRAME_MS since start.
+        self._roll_start_ms = 0
+        self._roll_start_face = 1
         # Result for last completed roll
         self.roll_result = None
 
@@ -186,22 +261,28 @@ class Bones21Scene(Scene):
         self.turn_pause_until = 0
 
         # history
-        self.hist = [[], []]
+        self.hist = [deque(maxlen=HIST_MAX), deque(maxlen=HIST_MAX)]
 
         # NPC cadence
-        self.npc_next = pygame.time.get_ticks() + random.randint(*NPC_THINK_MS)
+        # Frame timestamp: read once at the top of update()/draw(); anything that
+        # can also run from handle_event() keeps calling get_ticks() directly.
+        self._now = pygame.time.get_ticks()
+        self.npc_next = self._now + random.randint(*NPC_THINK_MS)
         self.npc_stop_at = 0  # when NPC will press stop
         if self.net_enabled and self.participants:
             rng = random.Random(f"bones21-start-{self.duel_id}")
             self.turn = rng.choice([0, 1])
         else:
             self.turn = 0
+        self._is_local_turn = self._local_turn()  # refreshed whenever turn changes
+        self._last_net_key = None  # last state sent; identical unforced sends are dropped
         # Send initial state so both sides start aligned.
         if self.net_enabled:
             self._net_send_state("init", force=True)
 
     # ---------- flow helpers ----------
     def _local_turn(self):
+        # Hot paths read the cached self._is_local_turn instead.
         return (not self.net_enabled) or self.turn == self.local_idx
 
     def _net_send_action(self, action: dict):
@@ -215,8 +296,16 @@ class Bones21Scene(Scene):
     def _net_send_state(self, kind="state", extra=None, force=False):
         if not self.net_enabled:
             return
-        if not force and not self._local_turn():
+        if not force and not self._is_local_turn:
+            return
+        key = (
+            kind, self.turn, tuple(self.tot), self.rolls_done, self.rolling, self.roll_result,
+            self.spinner_face, self.turn_pausing, self.finished, self.winner,
+        )
+        if not force and not extra and key == self._last_net_key:
             return
+        self._last_net_key = key
+        now = pygame.time.get_ticks()
         payload = {
             "kind": kind,
             "turn": self.turn,
@@ -226,13 +315,15 @@ class Bones21Scene(Scene):
             "roll_result": self.roll_result,
             "spinner_face": self.spinner_face,
             "turn_pausing": self.turn_pausing,
-            "pause_ms": max(0, int(self.turn_pause_until - pygame.time.get_ticks())) if self.turn_pausing else 0,
+            "pause_ms": max(0, int(self.turn_pause_until - now)) if self.turn_pausing else 0,
             "finished": self.finished,
             "winner_idx": self.winner,
-            "hist": [list(h) for h in self.hist],
         }
+        # History only changes when a roll lands; the receiver keeps its copy otherwise.
+        if kind in NET_HIST_KINDS:
+            payload["hist"] = [list(h) for h in self.hist]
         if self.bust_flash_until:
-            payload["bust_ms"] = max(0, int(self.bust_flash_until - pygame.time.get_ticks()))
+            payload["bust_ms"] = max(0, int(self.bust_flash_until - now))
         if extra:
             payload.update(extra)
         self._net_send_action(payload)
@@ -240,15 +331,26 @@ class Bones21Scene(Scene):
     def _net_poll_actions(self, dt: float):
         if not self.net_enabled or not self.net_client:
             return
-        while True:
+        # Every message is a full snapshot (hist only on some kinds), so a
+        # bounded burst folds into one apply: later fields win, earlier hist
+        # survives when later messages omit it.
+        merged = None
+        for _ in range(NET_POLL_MAX):
             msg = self.net_client.pop_duel_action(self.duel_id)
             if not msg:
                 break
             sender = msg.get("from")
             if sender and self.local_id and sender == self.local_id:
                 continue
-            action = msg.get("action") or {}
-            self._net_apply_state(action)
+            action = msg.get("action")
+            if not action:
+                continue
+            if merged is None:
+                merged = dict(action)
+            else:
+                merged.update(action)
+        if merged:
+            self._net_apply_state(merged)
 
     def _net_apply_state(self, action: dict):
         if not action:
@@ -258,6 +360,7 @@ class Bones21Scene(Scene):
             self.turn = int(action.get("turn", self.turn))
         except Exception:
             pass
+        self._is_local_turn = self._local_turn()
         tot = action.get("tot")
         if isinstance(tot, list) and len(tot) >= 2:
             try:
@@ -273,19 +376,24 @@ class Bones21Scene(Scene):
             self.spinner_face = int(action.get("spinner_face", self.spinner_face))
         except Exception:
             pass
+        now = self._now  # only applied from update(), via _net_poll_actions
+        if self.rolling:
+            # Re-anchor the local spinner on the face the roller reported.
+            self._roll_start_ms = now
+            self._roll_start_face = self.spinner_face
         self.roll_result = action.get("roll_result", self.roll_result)
         self.turn_pausing = bool(action.get("turn_pausing", False))
         pause_ms = int(action.get("pause_ms", 0) or 0)
         if self.turn_pausing and pause_ms > 0:
-            self.turn_pause_until = pygame.time.get_ticks() + pause_ms
+            self.turn_pause_until = now + pause_ms
         else:
-            self.turn_pause_until = pygame.time.get_ticks()
+            self.turn_pause_until = now
         bust_ms = int(action.get("bust_ms", 0) or 0)
         if bust_ms:
-            self.bust_flash_until = pygame.time.get_ticks() + bust_ms
+            self.bust_flash_until = now + bust_ms
         hist = action.get("hist")
         if isinstance(hist, list) and len(hist) == 2:
-            self.hist = [list(hist[0] or []), list(hist[1] or [])]
+            self.hist = [deque(hist[0] or (), maxlen=HIST_MAX), deque(hist[1] or (), maxlen=HIST_MAX)]
         winner_idx = action.get("winner_idx")
         if winner_idx is not None:
             self.winner = winner_idx
@@ -305,21 +413,29 @@ class Bones21Scene(Scene):
             or self.pending_outcome
         ):
             return
-        if self.net_enabled and not self._local_turn():
+        if self.net_enabled and not self._is_local_turn:
             return
         self.rolling = True
-        self.roll_acc = 0.0
         # randomize starting face so phase is varied
         self.spinner_face = random.randint(1, 6)
+        self._roll_start_ms = pygame.time.get_ticks()
+        self._roll_start_face = self.spinner_face
         self.roll_result = None
         self._net_send_state("start")
 
+    def _spin_face(self, now):
+        """Spinner face at ``now``: strict loop 1→2→…→6→1 from the roll's anchor."""
+        # whole steps since the roll started, in integer ticks (no float drift)
+        steps = (now - self._roll_start_ms) // SPINNER_FRAME_MS
+        return ((self._roll_start_face - 1 + steps) % 6) + 1
+
     def _press_stop(self):
         if not self.rolling:
             return
-        if self.net_enabled and not self._local_turn():
+        if self.net_enabled and not self._is_local_turn:
             return
         # immediate stop on the current face
+        self.spinner_face = self._spin_face(pygame.time.get_ticks())
         self.rolling = False
         self._end_roll(self.spinner_face)
 
@@ -327,9 +443,7 @@ class Bones21Scene(Scene):
         now = pygame.time.get_ticks()
         self.roll_result = value
         # record history
-        self.hist[self.turn].append(value)
-        if len(self.hist[self.turn]) > HIST_MAX:
-            self.hist[self.turn] = self.hist[self.turn][-HIST_MAX:]
+        self.hist[self.turn].append(value)  # bounded deque drops the oldest
 
         # apply score
         self.tot[self.turn] += value
@@ -351,6 +465,7 @@ class Bones21Scene(Scene):
     def _next_turn(self):
         self.rolls_done = 0
         self.turn = 1 - self.turn
+        self._is_local_turn = self._local_turn()
         self.turn_pausing = False
         self.turn_pause_until = 0
         if self.net_enabled:
@@ -453,7 +568,7 @@ class Bones21Scene(Scene):
             return
         if self.finished or self.turn_pausing:
             return
-        if event.type == pygame.KEYDOWN and self._local_turn():
+        if event.type == pygame.KEYDOWN and self._is_local_turn:
             if event.key in (pygame.K_SPACE, pygame.K_RETURN):
                 # toggle start/stop on player input
                 if not self.rolling and self.rolls_done < 2:
@@ -462,20 +577,19 @@ class Bones21Scene(Scene):
                     self._press_stop()
 
     def update(self, dt):
+        self._now = now = pygame.time.get_ticks()
         self._net_poll_actions(dt)
         if self.pending_outcome:
             if self.banner.update(dt):
                 self._finalize(self.pending_outcome)
             return
 
-        now = pygame.time.get_ticks()
-
         # after-roll pause handling
         if self.turn_pausing and not self.finished:
             if now >= self.turn_pause_until:
                 self.turn_pausing = False
                 if self.net_enabled:
-                    if self._local_turn() and self.rolls_done >= 2:
+                    if self._is_local_turn and self.rolls_done >= 2:
                         self._next_turn()
                 else:
                     if self.rolls_done >= 2:
@@ -487,7 +601,7 @@ class Bones21Scene(Scene):
         # Multiplayer safety: if we've finished our two rolls and aren't paused, push turn forward.
         if (
             self.net_enabled
-            and self._local_turn()
+            and self._is_local_turn
             and not self.finished
             and not self.rolling
             and self.rolls_done >= 2
@@ -502,57 +616,61 @@ class Bones21Scene(Scene):
             elif self.rolling and now >= self.npc_stop_at:
                 self._press_stop()
 
-        # Spinner update: strict loop 1→2→…→6→1 while rolling
-        if self.rolling:
-            # accumulate in milliseconds, advance by whole steps using divmod to avoid loops
-            self.roll_acc += dt * 1000.0
-            steps, self.roll_acc = divmod(self.roll_acc, SPINNER_FRAME_MS)
-            if steps:
-                self.spinner_face = ((self.spinner_face - 1 + int(steps)) % 6) + 1
-
     # ---------- rendering ----------
-    def _draw_background(self):
-        self.view.fill((12, 14, 18))
+    def _build_static_bg(self):
+        """Background plus both score tracks (and the bust overlay), built once per scene size."""
+        self._static_bg = pygame.Surface((self.w, self.h)).convert()
+        self._draw_background(self._static_bg)
+        self._draw_track(self._static_bg, TRACK_Y_P1)
+        self._draw_track(self._static_bg, TRACK_Y_P2)
+        self._bust_flash = pygame.Surface((self.w, self.h), pygame.SRCALPHA).convert_alpha()
+        self._bust_flash.fill((180, 40, 40, 80))
+        self._static_size = (self.w, self.h)
+
+    def _draw_background(self, surf):
+        surf.fill((12, 14, 18))
         self.bg_pos = (0, 0)
         if self.bg_img:
             rect = self.bg_img.get_rect(center=(self.w // 2, self.h // 2))
             self.bg_pos = (rect.left, rect.top)
-            self.view.blit(self.bg_img, rect.topleft)
+            surf.blit(self.bg_img, rect.topleft)
         else:
             for i in range(0, self.w, 32):
-                pygame.draw.line(self.view, (16, 18, 26), (i, 0), (i, self.h), 1)
-
-    def _draw_track(self, y):
-        ox, oy = self.bg_pos if self.bg_img else (0, 0)
-        x = TRACK_X0
-        if self.sheet.surf:
-            self.view.blit(
-                self.sheet.frame(S_IDX["track_L"]), (ox + x - 16, oy + y - 16)
-            )
+                pygame.draw.line(surf, (16, 18, 26), (i, 0), (i, self.h), 1)
+
+    def _track_blits(self, ox, oy, y):
+        """(frame, pos) sequence for one sprite track, built once per origin."""
+        key = (ox, oy, y)
+        seq = self._track_blit_cache.get(key)
+        if seq is None:
+            frame = self.sheet.frame
+            x = TRACK_X0
+            seq = [(frame(S_IDX["track_L"]), (ox + x - 16, oy + y - 16))]
             for i in range(TRACK_STOPS):
-                self.view.blit(
-                    self.sheet.frame(S_IDX["track_mid"]), (ox + x - 16, oy + y - 16)
-                )
                 tick = "tick_big" if i % 5 == 0 else "tick_sm"
-                self.view.blit(
-                    self.sheet.frame(S_IDX[tick]), (ox + x - 16, oy + y - 16)
-                )
+                seq.append((frame(S_IDX["track_mid"]), (ox + x - 16, oy + y - 16)))
+                seq.append((frame(S_IDX[tick]), (ox + x - 16, oy + y - 16)))
                 x += TRACK_STEP
-            self.view.blit(
-                self.sheet.frame(S_IDX["track_R"]), (ox + x - 16, oy + y - 16)
-            )
+            seq.append((frame(S_IDX["track_R"]), (ox + x - 16, oy + y - 16)))
+            self._track_blit_cache[key] = seq
+        return seq
+
+    def _draw_track(self, surf, y):
+        ox, oy = self.bg_pos if self.bg_img else (0, 0)
+        if self.sheet.surf:
+            surf.blits(self._track_blits(ox, oy, y), False)
             return
         x = TRACK_X0
         for i in range(TRACK_STOPS):
             pygame.draw.rect(
-                self.view,
+                surf,
                 (60, 70, 85),
                 (ox + x - 8, oy + y - 10, 16, 20),
                 border_radius=6,
             )
             if i % 5 == 0:
                 pygame.draw.rect(
-                    self.view,
+                    surf,
                     (200, 220, 255),
                     (ox + x - 1, oy + y - 8, 2, 16),
                     1,
@@ -560,24 +678,21 @@ class Bones21Scene(Scene):
                 )
             x += TRACK_STEP
 
+    def _bead_blit(self, who, y):
+        """(frame, pos) for a sprite bead."""
+        ox, oy = self.bg_pos if self.bg_img else (0, 0)
+        t = max(0, min(21, self.tot[who]))
+        return self._bead_frames[who, t % 5 == 0], (ox + BEAD_X[t] - 16, oy + y - 16)
+
     def _draw_bead(self, who, y):
+        """Vector bead (no spritesheet)."""
         ox, oy = self.bg_pos if self.bg_img else (0, 0)
         t = max(0, min(21, self.tot[who]))
-        x = TRACK_X0 + t * TRACK_STEP
-        squash = t % 5 == 0
-        if self.sheet.surf:
-            idx = (
-                ("bead_p1sq" if squash else "bead_p1")
-                if who == 0
-                else ("bead_p2sq" if squash else "bead_p2")
-            )
-            self.view.blit(self.sheet.frame(S_IDX[idx]), (ox + x - 16, oy + y - 16))
-        else:
-            col = (255, 215, 120) if who == 0 else (120, 200, 255)
-            if squash:
-                pygame.draw.ellipse(self.view, col, (ox + x - 10, oy + y - 8, 20, 16))
-            else:
-                pygame.draw.circle(self.view, col, (ox + x, oy + y), 8)
+        x = BEAD_X[t]
+        col = (255, 215, 120) if who == 0 else (120, 200, 255)
+        if t % 5 == 0:
+            return pygame.draw.ellipse(self.view, col, (ox + x - 10, oy + y - 8, 20, 16))
+        return pygame.draw.circle(self.view, col, (ox + x, oy + y), 8)
 
     def _dice_center(self):
         if self.bg_img:
@@ -585,20 +700,19 @@ class Bones21Scene(Scene):
             return ox + 320, oy + 150
         return self.w // 2, 150
 
+    def _dice_blit(self):
+        """(frame, rect) for the sprite die."""
+        face = self.spinner_face if self.rolling else (self.roll_result or 1)
+        size = (FW * self.DICE_SCALE, FH * self.DICE_SCALE) if self.DICE_SCALE != 1 else None
+        frm = self.sheet.frame(FACE_IDX.get(face, FACE_IDX[1]), size)
+        return frm, frm.get_rect(center=self._dice_center())
+
     def _draw_dice(self, cx=None, cy=None):
+        """Vector die (no spritesheet)."""
         if cx is None or cy is None:
             cx, cy = self._dice_center()
-        if self.sheet.surf:
-            face = self.spinner_face if self.rolling else (self.roll_result or 1)
-            frm = self.sheet.frame(FACE_IDX.get(face, FACE_IDX[1]))
-            if self.DICE_SCALE != 1:
-                frm = pygame.transform.scale(
-                    frm, (FW * self.DICE_SCALE, FH * self.DICE_SCALE)
-                )
-            self.view.blit(frm, frm.get_rect(center=(cx, cy)))
-            return
         size = int(36 * self.DICE_SCALE)
-        pygame.draw.rect(
+        box = pygame.draw.rect(
             self.view,
             (235, 235, 245),
             (cx - size // 2, cy - size // 2, size, size),
@@ -616,45 +730,68 @@ class Bones21Scene(Scene):
             if self.rolling
             else (self.roll_result if self.roll_result is not None else 1)
         )
-        rng = random.Random(1234 + val)
-        for _ in range(val):
+        for dx, dy in PIP_OFFSETS.get(val) or _pip_offsets(val):
             pygame.draw.circle(
                 self.view,
                 (40, 45, 60),
-                (cx + rng.randint(-8, 8), cy + rng.randint(-8, 8)),
+                (cx + dx, cy + dy),
                 max(3, self.DICE_SCALE),
             )
+        return box
 
-    def _draw_history(self):
-        if not self.sheet.surf:
-            return
+    def _history_blits(self):
+        """(tile, pos) pairs for both history ribbons (sprite mode only)."""
         ox, oy = self.bg_pos if self.bg_img else (0, 0)
+        tiles = self._hist_tiles
+        step = HIST_TILE + HIST_SPACING
         # Player 1 — top-right, newest on RIGHT, drawn right->left
-        vals1 = list(self.hist[0])[-HIST_MAX:]
+        vals1 = self.hist[0]
         x = ox + 640 - RIB_TR_RIGHT_MARGIN - HIST_TILE
         y = oy + RIB_TR_Y
-        for v in reversed(vals1):
-            frm = self.sheet.frame(FACE_IDX.get(v, FACE_IDX[1]))
-            if frm:
-                tile = pygame.transform.scale(frm, (HIST_TILE, HIST_TILE))
-                self.view.blit(tile, (x, y))
-            x -= HIST_TILE + HIST_SPACING
+        ribbon = [(tiles.get(v, tiles[1]), (x - i * step, y)) for i, v in enumerate(reversed(vals1))]
         # Player 2 — bottom-left, newest on LEFT, drawn left->right
-        vals2 = list(self.hist[1])[-HIST_MAX:]
+        vals2 = self.hist[1]
         x = ox + RIB_BL_LEFT_MARGIN
         y = oy + RIB_BL_Y
-        for v in reversed(vals2):
-            frm = self.sheet.frame(FACE_IDX.get(v, FACE_IDX[1]))
-            if frm:
-                tile = pygame.transform.scale(frm, (HIST_TILE, HIST_TILE))
-                self.view.blit(tile, (x, y))
-            x += HIST_TILE + HIST_SPACING
+        ribbon += [(tiles.get(v, tiles[1]), (x + i * step, y)) for i, v in enumerate(reversed(vals2))]
+        return ribbon
+
+    def _text(self, font, text, color):
+        """Rendered text, cached; HUD strings repeat every frame and change rarely."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._text_cache[key] = font.render(text, True, color)
+        return surf
 
     def draw(self):
-        self._draw_background()
+        self._now = now = pygame.time.get_ticks()
+        flashing = now < self.bust_flash_until
+        if self.rolling:
+            # The spinner is not ticked in update(); the face only changes (and
+            # dirties the view) when a whole step has elapsed.
+            self.spinner_face = self._spin_face(now)
+        # Everything drawn below is a function of this key (the banner animates,
+        # so outcome frames always redraw). Unchanged -> re-present the last view.
+        key = (
+            self.w, self.h, self.turn, self.tot[0], self.tot[1], self.rolls_done,
+            self.rolling, self.spinner_face, self.roll_result, self.turn_pausing,
+            flashing, tuple(self.hist[0]), tuple(self.hist[1]),
+        )
+        on_top = self._on_top()
+        if key == self._view_key and not self.pending_outcome:
+            if not (on_top and self._screen_synced):
+                self.screen.blit(self.view, (0, 0))
+                self._screen_synced = on_top
+            return
+        self._view_key = key
+
+        if self._static_size != (self.w, self.h):
+            self._build_static_bg()
+        self.view.blit(self._static_bg, (0, 0))
 
         # Title + HUD
-        title = self.big.render(TITLE, True, (245, 235, 160))
+        title = self._title_surf
         self.view.blit(title, (self.w // 2 - title.get_width() // 2, 36))
         pturn = (
             self.labels[self.turn]
@@ -663,7 +800,7 @@ class Bones21Scene(Scene):
         )
         # Dynamic hint for player
         hint = None
-        if self._local_turn() and not self.turn_pausing and self.rolls_done < 2:
+        if self._is_local_turn and not self.turn_pausing and self.rolls_done < 2:
             if not self.rolling:
                 hint = "SPACE to START"
             else:
@@ -671,56 +808,68 @@ class Bones21Scene(Scene):
         info_text = f"Turn: {pturn}  •  Rolls this turn: {self.rolls_done}/2"
         if hint:
             info_text += f"  •  {hint}"
-        info = self.font.render(info_text, True, (225, 230, 240))
-        self.view.blit(info, (self.w // 2 - info.get_width() // 2, 76))
+        info = self._text(self.font, info_text, (225, 230, 240))
+        dirty = [self.view.blit(info, (self.w // 2 - info.get_width() // 2, 76))]
 
         # Bust flash
-        if pygame.time.get_ticks() < self.bust_flash_until:
-            flash = pygame.Surface((self.w, self.h), pygame.SRCALPHA)
-            flash.fill((180, 40, 40, 80))
-            self.view.blit(flash, (0, 0))
-
-        # Tracks + beads
-        self._draw_track(TRACK_Y_P1)
-        self._draw_track(TRACK_Y_P2)
-        self._draw_bead(0, TRACK_Y_P1)
-        self._draw_bead(1, TRACK_Y_P2)
+        if flashing:
+            self.view.blit(self._bust_flash, (0, 0))
+
+        # Beads, labels, badges, die and history go out in one blits() call,
+        # in that (overlap) order; without a sheet the vector beads/die are
+        # drawn directly around it.
+        sprites = bool(self.sheet.surf)
+        if sprites:
+            seq = [self._bead_blit(0, TRACK_Y_P1), self._bead_blit(1, TRACK_Y_P2)]
+        else:
+            seq = []
+            dirty.append(self._draw_bead(0, TRACK_Y_P1))
+            dirty.append(self._draw_bead(1, TRACK_Y_P2))
 
         # Labels: Player 1 (left) and Player 2 (right) on the SAME Y
         ox, oy = self.bg_pos if self.bg_img else (0, 0)
         label0 = self.labels[0] if self.is_multiplayer else "Player 1"
         label1 = self.labels[1] if self.is_multiplayer else "Player 2"
-        p1_lbl = self.font.render(f"{label0}: {self.tot[0]}", True, (255, 230, 140))
-        p2_lbl = self.font.render(f"{label1}: {self.tot[1]}", True, (150, 210, 255))
+        p1_lbl = self._text(self.font, f"{label0}: {self.tot[0]}", (255, 230, 140))
+        p2_lbl = self._text(self.font, f"{label1}: {self.tot[1]}", (150, 210, 255))
         label_y = oy + TRACK_Y_P1 - 40
-        self.view.blit(p1_lbl, (ox + 24, label_y))
-        self.view.blit(p2_lbl, (ox + 640 - 24 - p2_lbl.get_width(), label_y))
+        seq.append((p1_lbl, (ox + 24, label_y)))
+        seq.append((p2_lbl, (ox + 640 - 24 - p2_lbl.get_width(), label_y)))
 
         # small badges '1' and '2' by the track starts
-        for who, y, label in [(0, TRACK_Y_P1, "1"), (1, TRACK_Y_P2, "2")]:
-            badge = pygame.Surface((20, 20), pygame.SRCALPHA)
-            pygame.draw.rect(badge, (24, 28, 40), (0, 0, 20, 20), border_radius=6)
-            pygame.draw.rect(badge, (80, 90, 120), (0, 0, 20, 20), 2, border_radius=6)
-            txt = self.small.render(
-                label, True, (255, 230, 160) if who == 0 else (180, 220, 255)
-            )
-            badge.blit(txt, (10 - txt.get_width() // 2, 10 - txt.get_height() // 2))
-            self.view.blit(badge, (ox + TRACK_X0 - 28, oy + y - 10))
+        for badge, y in zip(self._badges, (TRACK_Y_P1, TRACK_Y_P2)):
+            seq.append((badge, (ox + TRACK_X0 - 28, oy + y - 10)))
 
         # Dice and history ribbons
-        self._draw_dice()
-        self._draw_history()
+        if sprites:
+            seq.append(self._dice_blit())
+            seq += self._history_blits()
+        dirty += self.view.blits(seq)
+        if not sprites:
+            dirty.append(self._draw_dice())
 
         if self.pending_outcome:
             self.banner.draw(self.view, self.big, self.small, (self.w, self.h))
 
         if self._asset_note:
-            note = self.small.render(
-                " | ".join(self._asset_note), True, (255, 120, 120)
-            )
+            note = self._text(self.small, " | ".join(self._asset_note), (255, 120, 120))
             self.view.blit(note, (12, 8))
 
-        self.screen.blit(self.view, (0, 0))
+        # Present: while we own the screen and it already shows the previous
+        # view, copy only what changed this frame and last frame; the flash and
+        # banner cover the whole view, so those frames (and the next) go in full.
+        prev = self._prev_dirty
+        if on_top and self._screen_synced and prev is not None and not flashing and not self.pending_outcome:
+            self.screen.blits([(self.view, r, r) for r in (*prev, *dirty)], False)
+            self._prev_dirty = dirty
+        else:
+            self.screen.blit(self.view, (0, 0))
+            self._screen_synced = on_top
+            self._prev_dirty = None if (flashing or self.pending_outcome) else dirty
+
+    def _on_top(self):
+        scenes = getattr(self.manager, "scenes", None)
+        return not scenes or scenes[-1] is self
 
 
 def launch(manager, context, callback, **kwargs):
@@ -1,7 +1,6 @@
 # minigames/brick_dropper/game.py
 import math
 import random
-import copy
 import pygame
 from scene_manager import Scene
 from game_context import GameContext
@@ -43,8 +42,25 @@ BASE_CFG = {
     "AI_BRAIN_FART_PCT": 0.03,  # small chance to be late/early on purpose
 }
 
+# Fixed simulation step: rows, fallers and the AI advance in 120 Hz substeps so
+# a frame hitch can't carry a row past the AI's trigger window in one jump.
+SIM_STEP = 1.0 / 120.0
+
 # Working CFG (mutated by difficulty)
-CFG = copy.deepcopy(BASE_CFG)
+CFG = dict(BASE_CFG)  # values are immutable, so a shallow copy is enough
+
+
+def _publish_cfg():
+    """Mirror the per-frame CFG keys into module globals (plain loads, no dict lookups)."""
+    global _CFG_COLS, _CFG_FH, _CFG_FALL_TIME, _CFG_GRID, _CFG_AI_TOLERANCE
+    _CFG_COLS = CFG["COLS"]
+    _CFG_FH = CFG["FINISH_HEIGHT"]
+    _CFG_FALL_TIME = CFG["FALL_TIME"]
+    _CFG_GRID = CFG["GRID"]
+    _CFG_AI_TOLERANCE = CFG["AI_TOLERANCE"]
+
+
+_publish_cfg()
 
 
 # Fallback font loader if content_registry isn't available
@@ -74,6 +90,12 @@ def _get_fonts():
 # -------------------------
 # Helpers
 # -------------------------
+# Bound once: the AI/round RNG draws skip the module attribute lookup.
+_rrandom = random.random
+_runiform = random.uniform
+_rrandint = random.randint
+
+
 def clamp(v, a, b):
     return max(a, min(b, v))
 
@@ -82,15 +104,29 @@ def lerp(a, b, t):
     return a + (b - a) * t
 
 
-def color_for_level(level, total=12, base=(90, 200, 255), top=(255, 120, 100)):
-    t = clamp((level - 1) / max(1, total - 1), 0, 1)
+def _iround(x, _floor=math.floor):
+    """Round half up to int: one C call instead of int(round(x))."""
+    return _floor(x + 0.5)
+
+
+def color_for_level(level, total=12, base=(90, 200, 255), top=(255, 120, 100), _clamp=clamp, _lerp=lerp):
+    t = _clamp((level - 1) / max(1, total - 1), 0, 1)
     return (
-        int(lerp(base[0], top[0], t)),
-        int(lerp(base[1], top[1], t)),
-        int(lerp(base[2], top[2], t)),
+        int(_lerp(base[0], top[0], t)),
+        int(_lerp(base[1], top[1], t)),
+        int(_lerp(base[2], top[2], t)),
     )
 
 
+def _build_level_colors():
+    """Row color per level (index = level, 0..FINISH_HEIGHT+1) for the working CFG."""
+    fh, base, top = CFG["FINISH_HEIGHT"], CFG["COLOR_BASE"], CFG["COLOR_TOP"]
+    return tuple(color_for_level(level, fh, base, top) for level in range(fh + 2))
+
+
+_LEVEL_COLOR_LUT = _build_level_colors()
+
+
 def _normalize_difficulty(value):
     """
     Accepts strings or numbers and returns 'easy' | 'normal' | 'hard'.
@@ -123,6 +159,8 @@ def _normalize_difficulty(value):
 # Core objects
 # -------------------------
 class Row:
+    __slots__ = ("cols", "width", "left", "level", "dir", "speed", "color", "prev_left", "ileft")
+
     def __init__(self, cols, width, left, level, dir_sign, speed_cps, color):
         self.cols = cols
         self.width = width
@@ -132,24 +170,26 @@ class Row:
         self.speed = speed_cps  # columns per second
         self.color = color
         self.prev_left = float(left)
+        self.ileft = _iround(self.left)  # drawn cell column, refreshed by update()
 
     def update(self, dt):
-        self.prev_left = self.left
-        self.left += self.dir * self.speed * dt
+        self.prev_left = left = self.left
+        left += self.dir * self.speed * dt
         # bounce on walls
-        if self.left < 0:
-            self.left = -self.left
-            self.dir *= -1
-        if self.left + self.width > self.cols:
-            over = (self.left + self.width) - self.cols
-            self.left = self.cols - self.width - over
-            self.dir *= -1
-
-    def int_left(self):
-        return int(round(self.left))
+        if left < 0:
+            left = -left
+            self.dir = -self.dir
+        right = left + self.width
+        if right > self.cols:
+            left -= 2 * (right - self.cols)
+            self.dir = -self.dir
+        self.left = left
+        self.ileft = int(left + 0.5)  # left >= 0 after the wall bounce
 
 
 class Faller:
+    __slots__ = ("left", "width", "y", "vy", "ttl", "color")
+
     def __init__(self, left_block, width_blocks, level, ttl, color):
         self.left = float(left_block)
         self.width = width_blocks
@@ -157,13 +197,90 @@ class Faller:
         self.vy = 10.0  # grid blocks per second (visual)
         self.ttl = ttl
         self.color = color
-        self.alive = True
 
-    def update(self, dt):
-        self.y += self.vy * dt
-        self.ttl -= dt
-        if self.ttl <= 0:
-            self.alive = False
+
+def _draw_pane_bg(surf, rect, cell):
+    """Static pane art: background, border, grid and finish line."""
+    x, y, w, h = rect
+    pygame.draw.rect(surf, CFG["FIELD_BG"], rect, border_radius=10)
+    pygame.draw.rect(surf, CFG["FIELD_BORDER"], rect, 2, border_radius=10)
+
+    # Draw grid
+    cols, fh, grid = _CFG_COLS, _CFG_FH, _CFG_GRID
+    for c in range(cols + 1):
+        X = x + 10 + c * cell
+        pygame.draw.line(
+            surf,
+            grid,
+            (X, y + 10),
+            (X, y + 10 + fh * cell),
+        )
+    for r in range(fh + 1):
+        Y = y + 10 + r * cell
+        pygame.draw.line(
+            surf, grid, (x + 10, Y), (x + 10 + cols * cell, Y)
+        )
+
+    # Finish line marker (top of play area)
+    Yf = y + 10
+    pygame.draw.line(
+        surf, (255, 240, 120), (x + 10, Yf), (x + 10 + cols * cell, Yf), 2
+    )
+
+
+def _make_pane_bg(size, cell):
+    """Pre-render the static pane art once; both panes share the same size."""
+    bg = pygame.Surface(size, pygame.SRCALPHA)
+    _draw_pane_bg(bg, pygame.Rect((0, 0), size), cell)
+    return bg
+
+
+_FALLER_SURFS = {}
+_FALLER_SURFS_MAX = 256
+
+
+def _faller_surf(w_px, h_px, color, alpha_bucket):
+    """Translucent faller block, cached per size/color and 1/16th alpha step."""
+    key = (w_px, h_px, color, alpha_bucket)
+    surf = _FALLER_SURFS.get(key)
+    if surf is None:
+        if len(_FALLER_SURFS) >= _FALLER_SURFS_MAX:
+            _FALLER_SURFS.clear()
+        surf = pygame.Surface((w_px, h_px), pygame.SRCALPHA)
+        surf.fill((*color, alpha_bucket * 17))  # bucket 15 -> fully opaque
+        _FALLER_SURFS[key] = surf
+    return surf
+
+
+_TEXT_SURFS = {}
+_TEXT_SURFS_MAX = 128
+
+
+def _text(font, text, color):
+    """font.render, cached per (font, text, color); labels rarely change."""
+    key = (font, text, color)
+    surf = _TEXT_SURFS.get(key)
+    if surf is None:
+        if len(_TEXT_SURFS) >= _TEXT_SURFS_MAX:
+            _TEXT_SURFS.clear()
+        surf = _TEXT_SURFS[key] = font.render(text, True, color)
+    return surf
+
+
+_BLOCK_SPRITES = {}
+
+
+def _block_sprite(w_px, h_px, color):
+    """Rounded row block with its outline baked in, cached per size/color."""
+    key = (w_px, h_px, color)
+    sprite = _BLOCK_SPRITES.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((w_px, h_px), pygame.SRCALPHA)
+        rect = sprite.get_rect()
+        pygame.draw.rect(sprite, color, rect, border_radius=6)
+        pygame.draw.rect(sprite, (0, 0, 0), rect, 1, border_radius=6)
+        _BLOCK_SPRITES[key] = sprite
+    return sprite
 
 
 class StackWindow:
@@ -181,6 +298,12 @@ class StackWindow:
         self.finished = False
         self.finish_width = 0
         self.crashed = False
+        self._layout = None  # (cell, col_x, row_y) pixel tables, built on first draw
+        # Last drawn pane, re-blitted while nothing in it changes (READY/COOLDOWN).
+        self._pane_cache = None
+        self._pane_area = None  # screen rect the cache covers (fallers can leave the pane)
+        self._pane_key = None
+        self._dirty = True
 
         self.reset_round()
 
@@ -196,8 +319,11 @@ class StackWindow:
                 "color": self.row.color,
                 "prev_left": self.row.prev_left,
             }
+        # Static rows go out as one flat [left, width, level, ...] list; their
+        # color is always the level's ramp color, so the receiver rebuilds it.
         return {
-            "static_rows": list(self.static_rows),
+            "rows_v": 2,
+            "rows": [v for left, width, level, _ in self.static_rows for v in (left, width, level)],
             "row": row_state,
             "finished": self.finished,
             "finish_width": self.finish_width,
@@ -205,7 +331,16 @@ class StackWindow:
         }
 
     def apply_state(self, state: Dict[str, Any]):
-        self.static_rows = [tuple(s) for s in state.get("static_rows", [])]
+        self._dirty = True
+        flat = state.get("rows")
+        if flat is not None:
+            lut = _LEVEL_COLOR_LUT
+            self.static_rows = [
+                (flat[i], flat[i + 1], flat[i + 2], lut[flat[i + 2]])
+                for i in range(0, len(flat) - 2, 3)
+            ]
+        else:  # pre-v2 peers send the (left, width, level, color) tuples
+            self.static_rows = [tuple(s) for s in state.get("static_rows", [])]
         self.fallers = []  # drop transient debris to simplify syncing
         self.finished = bool(state.get("finished", False))
         self.crashed = bool(state.get("crashed", False))
@@ -219,12 +354,24 @@ class StackWindow:
                 row_state.get("level", 1),
                 row_state.get("dir", 1),
                 row_state.get("speed", self.speed_for_level(1)),
-                row_state.get("color", color_for_level(1, self.finish_h, CFG["COLOR_BASE"], CFG["COLOR_TOP"])),
+                row_state.get("color", _LEVEL_COLOR_LUT[1]),
             )
             self.row.prev_left = float(row_state.get("prev_left", self.row.left))
         else:
             self.row = None
 
+    def _layout_for(self, cell):
+        """Pixel x per column and y per level for this pane (constant for the match)."""
+        layout = self._layout
+        if layout is None or layout[0] != cell:
+            x0 = self.rect.x + 10
+            y0 = self.rect.y + 10
+            fh = self.finish_h
+            col_x = tuple(x0 + c * cell for c in range(self.cols + 1))
+            row_y = tuple(y0 + (fh - lvl) * cell for lvl in range(fh + 2))
+            layout = self._layout = (cell, col_x, row_y)
+        return layout
+
     def level_now(self):
         return len(self.static_rows) + 1
 
@@ -235,17 +382,16 @@ class StackWindow:
         return sp
 
     def reset_round(self):
+        self._dirty = True
         self.static_rows.clear()
         self.fallers.clear()
         # Initialize base row at level 1
         left = (self.cols - self.base_w) // 2
-        base_color = color_for_level(
-            1, self.finish_h, CFG["COLOR_BASE"], CFG["COLOR_TOP"]
-        )
+        base_color = _LEVEL_COLOR_LUT[1]
         self.static_rows.append((left, self.base_w, 1, base_color))
         # Spawn moving row (level 2)
-        dir_sign = 1 if random.random() < 0.5 else -1
-        c = color_for_level(2, self.finish_h, CFG["COLOR_BASE"], CFG["COLOR_TOP"])
+        dir_sign = 1 if _rrandom() < 0.5 else -1
+        c = _LEVEL_COLOR_LUT[2]
         self.row = Row(
             self.cols,
             self.base_w,
@@ -263,27 +409,26 @@ class StackWindow:
         """Stop the current row, compute overlap with last static row, spawn next or finish/crash."""
         if not self.row or self.finished or self.crashed:
             return
+        self._dirty = True
 
         r = self.row
-        last_left, last_w, _, _ = self.static_rows[-1]
-        L = int(round(r.left))
-        R = L + r.width
-        L2 = last_left
-        R2 = last_left + last_w
-
-        overlap_L = max(L, L2)
-        overlap_R = min(R, R2)
-        overlap = max(0, overlap_R - overlap_L)
-
-        # Make fallers for scraps (visual)
-        if L < L2:
-            w = max(0, min(r.width, L2 - L))
-            if w > 0:
-                self.fallers.append(Faller(L, w, r.level, CFG["FALL_TIME"], r.color))
-        if R > R2:
-            w = max(0, min(r.width, R - R2))
-            if w > 0:
-                self.fallers.append(Faller(R2, w, r.level, CFG["FALL_TIME"], r.color))
+        width = r.width
+        L2, last_w, _, _ = self.static_rows[-1]
+        L = _iround(r.left)
+        R = L + width
+        R2 = L2 + last_w
+
+        overlap_L = L if L > L2 else L2
+        overlap_R = R if R < R2 else R2
+        overlap = overlap_R - overlap_L
+
+        # Make fallers for scraps (visual); a perfectly aligned drop has none.
+        if L != L2 or R != R2:
+            level, fall_time, color = r.level, _CFG_FALL_TIME, r.color
+            if L < L2:
+                self.fallers.append(Faller(L, width if width < L2 - L else L2 - L, level, fall_time, color))
+            if R > R2:
+                self.fallers.append(Faller(R2, width if width < R - R2 else R - R2, level, fall_time, color))
 
         if overlap <= 0:
             self.crashed = True
@@ -302,9 +447,7 @@ class StackWindow:
         # spawn next row
         next_level = r.level + 1
         next_dir = -r.dir
-        next_color = color_for_level(
-            next_level, self.finish_h, CFG["COLOR_BASE"], CFG["COLOR_TOP"]
-        )
+        next_color = _LEVEL_COLOR_LUT[next_level]
         start_left = 0 if next_dir > 0 else (self.cols - placed_w)
         self.row = Row(
             self.cols,
@@ -317,77 +460,123 @@ class StackWindow:
         )
 
     def update(self, dt):
-        # Update fallers
-        for f in self.fallers:
-            f.update(dt)
-        self.fallers = [f for f in self.fallers if f.alive]
+        # Update fallers (integrated inline: no per-object method dispatch) and
+        # compact the survivors to the front of the same list in one pass.
+        fallers = self.fallers
+        if fallers:
+            self._dirty = True
+            j = 0
+            for f in fallers:
+                f.y += f.vy * dt
+                ttl = f.ttl = f.ttl - dt
+                if ttl > 0:
+                    fallers[j] = f
+                    j += 1
+            if j < len(fallers):
+                del fallers[j:]
 
         # Move row
         if self.row and not (self.finished or self.crashed):
             self.row.update(dt)
+            self._dirty = True
 
-    def draw(self, surf, cell, fonts, show_hud=True, is_player=True):
+    def draw(self, surf, cell, fonts, show_hud=True, is_player=True, bg_surf=None):
         big, mid, sml = fonts
         x, y, w, h = self.rect
-        # Pane background
-        pygame.draw.rect(surf, CFG["FIELD_BG"], self.rect, border_radius=10)
-        pygame.draw.rect(surf, CFG["FIELD_BORDER"], self.rect, 2, border_radius=10)
-
-        # Draw grid
-        for c in range(CFG["COLS"] + 1):
-            X = x + 10 + c * cell
-            pygame.draw.line(
-                surf,
-                CFG["GRID"],
-                (X, y + 10),
-                (X, y + 10 + CFG["FINISH_HEIGHT"] * cell),
-            )
-        for r in range(CFG["FINISH_HEIGHT"] + 1):
-            Y = y + 10 + r * cell
-            pygame.draw.line(
-                surf, CFG["GRID"], (x + 10, Y), (x + 10 + CFG["COLS"] * cell, Y)
-            )
+        key = (cell, show_hud, bg_surf is not None)
+        if not self._dirty and self._pane_cache is not None and self._pane_key == key:
+            surf.blit(self._pane_cache, self._pane_area)
+            return
 
-        # Finish line marker (top of play area)
-        Yf = y + 10
-        pygame.draw.line(
-            surf, (255, 240, 120), (x + 10, Yf), (x + 10 + CFG["COLS"] * cell, Yf), 2
-        )
+        # Pane background, grid and finish line (static; pre-rendered when given)
+        if bg_surf is not None:
+            surf.blit(bg_surf, (x, y))
+        else:
+            _draw_pane_bg(surf, self.rect, cell)
 
-        # Draw static rows
-        for left, w_blocks, level, color in self.static_rows:
-            rx = x + 10 + left * cell
-            ry = y + 10 + (CFG["FINISH_HEIGHT"] - level) * cell
-            rect = pygame.Rect(rx, ry, w_blocks * cell, cell)
-            pygame.draw.rect(surf, color, rect, border_radius=6)
-            pygame.draw.rect(surf, (0, 0, 0), rect, 1, border_radius=6)
+        fh = _CFG_FH
+        _, col_x, row_y = self._layout_for(cell)
 
-        # Draw moving row
+        # Draw static rows + moving row in one batch
+        blocks = [
+            (_block_sprite(w_blocks * cell, cell, tuple(color)), (col_x[left], row_y[level]))
+            for left, w_blocks, level, color in self.static_rows
+        ]
         if self.row and not (self.finished or self.crashed):
             r = self.row
-            rx = x + 10 + int(round(r.left)) * cell
-            ry = y + 10 + (CFG["FINISH_HEIGHT"] - r.level) * cell
-            rect = pygame.Rect(rx, ry, r.width * cell, cell)
-            pygame.draw.rect(surf, r.color, rect, border_radius=6)
-            pygame.draw.rect(surf, (0, 0, 0), rect, 1, border_radius=6)
+            blocks.append(
+                (_block_sprite(r.width * cell, cell, tuple(r.color)), (col_x[r.ileft], row_y[r.level]))
+            )
+        surf.blits(blocks, False)
 
         # Draw fallers
+        fall_time = _CFG_FALL_TIME
+        area = self.rect
         for f in self.fallers:
-            rx = x + 10 + int(round(f.left)) * cell
-            ry = y + 10 + int(round(CFG["FINISH_HEIGHT"] - f.y)) * cell
+            rx = x + 10 + _iround(f.left) * cell
+            ry = y + 10 + _iround(fh - f.y) * cell
             rect = pygame.Rect(rx, ry, f.width * cell, cell)
-            alpha = int(255 * clamp(f.ttl / CFG["FALL_TIME"], 0, 1))
-            fall_surf = pygame.Surface(rect.size, pygame.SRCALPHA)
-            fall_surf.fill((*f.color, alpha))
-            surf.blit(fall_surf, rect.topleft)
+            life = f.ttl / fall_time
+            alpha = 0 if life <= 0 else (255 if life >= 1 else int(255 * life))
+            surf.blit(_faller_surf(rect.w, rect.h, tuple(f.color), alpha >> 4), rect.topleft)
             pygame.draw.rect(surf, (0, 0, 0, alpha), rect, 1)
+            area = area.union(rect)
 
         if show_hud:
             now = self.level_now()
-            label = f"{self.player_name} - Row {now}/{CFG['FINISH_HEIGHT']}"
-            t = mid.render(label, True, (230, 235, 245))
+            label = f"{self.player_name} - Row {now}/{fh}"
+            t = _text(mid, label, (230, 235, 245))
             surf.blit(t, (x + 14, y + h - t.get_height() - 10))
 
+        # Keep a copy of the finished pane for frames where nothing changes.
+        area = area.clip(surf.get_rect())
+        if self._pane_cache is None or self._pane_cache.get_size() != area.size:
+            self._pane_cache = pygame.Surface(area.size, 0, surf)
+        self._pane_cache.blit(surf, (0, 0), area)
+        self._pane_area = area
+        self._pane_key = key
+        self._dirty = False
+
+
+def _press_delay(row, target, need, tol):
+    """Seconds until ``row`` has spent ``need`` blocks of travel inside its trigger
+    windows: the last ``tol`` blocks before ``target``, in either direction, plus
+    the substep that crosses it (the stepped check counted that one too).
+
+    Rows move at constant speed and reflect off the walls, so unfolding the
+    bounce into a circle of length 2*span makes each window a fixed arc.
+    """
+    span = row.cols - row.width
+    if span <= 0 or row.speed <= 0:
+        return 0.0
+    period = 2 * span
+    step = row.speed * SIM_STEP
+    tol = max(tol, 1e-3)  # a zero-width window would never fill
+    # Moving right covers [0, span] of the circle, moving left [span, 2*span];
+    # each approach only counts travel in its own half, so a target at or near
+    # a wall can't count the same stretch twice. A substep that bounces off
+    # the near wall only counts if it started on the window side of target.
+    pos = row.left if row.dir > 0 else period - row.left
+    windows = []
+    for base, t in ((0.0, target), (span, span - target)):
+        lo = max(0.0, t - tol, step - t)
+        hi = min(t + step, span)
+        if hi > lo:
+            to_end = (base + hi - pos) % period
+            size = hi - lo
+            windows.append((max(0.0, to_end - size), to_end, size))  # start is 0 if already inside
+    if not windows:
+        return 0.0
+    windows.sort()
+    lap = 0.0
+    while True:
+        for start, end, _size in windows:
+            if need <= end - start:
+                return (lap + start + need) / row.speed
+            need -= end - start
+        lap += period
+        windows = [(end - size, end, size) for _, end, size in windows]
+
 
 class AIPlayer:
     """Times stop presses with configurable variance and small random errors."""
@@ -396,16 +585,17 @@ class AIPlayer:
         self.win = window
         self.target_left = None
         self.trigger_in = 0.0
+        self.t_to_press = 0.0  # seconds until the stop press
         self.brainfart = False
         self.diff_seed = difficulty_seed
         self.last_level_seen = self.win.level_now()
 
-    def _error_range_for_level(self, level):
+    def _error_range_for_level(self, level, _clamp=clamp, _lerp=lerp):
         lo_e, hi_e = CFG["AI_ERR_EASY"]
         lo_h, hi_h = CFG["AI_ERR_HARD"]
-        t = clamp((level - 1) / max(1, CFG["FINISH_HEIGHT"] - 1), 0, 1)
-        min_err = int(round(lerp(lo_e, lo_h, t)))
-        max_err = int(round(lerp(hi_e, hi_h, t)))
+        t = _clamp((level - 1) / max(1, CFG["FINISH_HEIGHT"] - 1), 0, 1)
+        min_err = int(round(_lerp(lo_e, lo_h, t)))
+        max_err = int(round(_lerp(hi_e, hi_h, t)))
         if max_err < min_err:
             max_err = min_err
         return (min_err, max_err)
@@ -418,14 +608,22 @@ class AIPlayer:
         ideal_left = last_left + (last_w - r.width) / 2.0
 
         emin, emax = self._error_range_for_level(r.level)
-        off_blocks = random.randint(emin, emax)
+        off_blocks = _rrandint(emin, emax)
         if off_blocks != 0:
-            off_blocks *= 1 if random.random() < 0.5 else -1
+            off_blocks *= 1 if _rrandom() < 0.5 else -1
 
-        target = clamp(ideal_left + off_blocks, 0, self.win.cols - r.width)
+        target = max(0, min(self.win.cols - r.width, ideal_left + off_blocks))
         self.target_left = target
-        self.trigger_in = random.uniform(CFG["AI_REACT_MIN"], CFG["AI_REACT_MAX"])
-        self.brainfart = random.random() < CFG["AI_BRAIN_FART_PCT"]
+        self.trigger_in = _runiform(CFG["AI_REACT_MIN"], CFG["AI_REACT_MAX"])
+        self.brainfart = _rrandom() < CFG["AI_BRAIN_FART_PCT"]
+
+        # The reaction time only runs down while the row is within AI_TOLERANCE
+        # blocks of the target, so the press lands once that much in-window
+        # travel has happened (a brain fart runs the clock a little fast).
+        reaction = self.trigger_in
+        if self.brainfart:
+            reaction /= 1.0 + _runiform(0.1, 0.3)
+        self.t_to_press = _press_delay(r, target, reaction * r.speed, _CFG_AI_TOLERANCE)
 
     def think(self, dt):
         if not self.win.row or self.win.finished or self.win.crashed:
@@ -436,20 +634,8 @@ class AIPlayer:
             self.last_level_seen = r.level
             self._pick_target_for_current_row()
 
-        crossed = False
-        tol = CFG["AI_TOLERANCE"]
-        if r.dir > 0:
-            crossed = r.prev_left <= self.target_left <= r.left + tol
-        else:
-            crossed = r.prev_left >= self.target_left >= r.left - tol
-
-        if crossed:
-            self.trigger_in -= dt
-            if self.brainfart:
-                self.trigger_in -= dt * random.uniform(0.1, 0.3)
-            if self.trigger_in <= 0:
-                return True
-        return False
+        self.t_to_press -= dt
+        return self.t_to_press <= 0
 
 
 # -------------------------
@@ -484,8 +670,8 @@ def _draw_match_hud(
     big, mid, sml = fonts
     cy = 26
     # Left label + pips
-    left_label = mid.render(left_name, True, (230, 235, 245))
-    right_label = mid.render(right_name, True, (230, 235, 245))
+    left_label = _text(mid, left_name, (230, 235, 245))
+    right_label = _text(mid, right_name, (230, 235, 245))
     left_x = w // 2 - 140
     right_x = w // 2 + 140
     screen.blit(
@@ -499,28 +685,36 @@ def _draw_match_hud(
     _draw_pips(screen, right_x, cy + 6, right_score, needed)
 
 
-def _draw_result_banner(screen, fonts, w, h, title_text, p_score, n_score, target_wins, p_name="YOU", o_name="Opponent"):
-    big, mid, sml = fonts
+def _make_overlay(w, h, alpha):
     overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 160))
+    overlay.fill((0, 0, 0, alpha))
+    return overlay
+
+
+def _draw_result_banner(
+    screen, fonts, w, h, title_text, p_score, n_score, target_wins, p_name="YOU", o_name="Opponent", overlay=None
+):
+    big, mid, sml = fonts
+    if overlay is None:
+        overlay = _make_overlay(w, h, 160)
     screen.blit(overlay, (0, 0))
-    title = big.render(title_text, True, (255, 240, 160))
+    title = _text(big, title_text, (255, 240, 160))
     screen.blit(title, title.get_rect(center=(w // 2, h // 2 - 28)))
     # Score pips centered under title
     _draw_pips(screen, w // 2 - 80, h // 2 + 18, p_score, target_wins)
     _draw_pips(screen, w // 2 + 80, h // 2 + 18, n_score, target_wins)
-    you = sml.render(p_name, True, (230, 235, 245))
-    opp = sml.render(o_name, True, (230, 235, 245))
+    you = _text(sml, p_name, (230, 235, 245))
+    opp = _text(sml, o_name, (230, 235, 245))
     screen.blit(you, you.get_rect(center=(w // 2 - 80, h // 2 + 38 + you.get_height())))
     screen.blit(opp, opp.get_rect(center=(w // 2 + 80, h // 2 + 38 + opp.get_height())))
 
 
-def _ready_countdown(screen, fonts, w, h, secs):
+def _ready_countdown(screen, fonts, w, h, secs, overlay=None):
     big, mid, sml = fonts
     n = int(math.ceil(secs))
-    t = big.render(str(n), True, (255, 255, 255))
-    overlay = pygame.Surface((w, h), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 120))
+    t = _text(big, str(n), (255, 255, 255))
+    if overlay is None:
+        overlay = _make_overlay(w, h, 120)
     screen.blit(overlay, (0, 0))
     screen.blit(t, t.get_rect(center=(w // 2, h // 2)))
 
@@ -528,8 +722,8 @@ def _ready_countdown(screen, fonts, w, h, secs):
 def _apply_difficulty(difficulty: str):
     """Mutate working CFG based on difficulty profile."""
     difficulty = (str(difficulty) or "normal").lower()
-    global CFG
-    CFG = copy.deepcopy(BASE_CFG)
+    global CFG, _LEVEL_COLOR_LUT
+    CFG = dict(BASE_CFG)
 
     if difficulty == "easy":
         CFG["AI_ERR_EASY"] = (3, 4)
@@ -543,6 +737,8 @@ def _apply_difficulty(difficulty: str):
         CFG["AI_TOLERANCE"] = 0.14
     else:
         pass
+    _publish_cfg()
+    _LEVEL_COLOR_LUT = _build_level_colors()
 
 
 class BrickDropperScene(Scene):
@@ -568,6 +764,7 @@ class BrickDropperScene(Scene):
         self.hint_text = self.font_small.render(
             "Space / Enter / Click to stop - Esc to pause", True, (205, 210, 220)
         )
+        self.hint_pos = (self.w // 2 - self.hint_text.get_width() // 2, self.h - 20)
 
         # Geometry setup
         pad = 16
@@ -579,6 +776,11 @@ class BrickDropperScene(Scene):
         cell_w = (pane_w - 20) // CFG["COLS"]
         cell_h = (pane_h - 20) // CFG["FINISH_HEIGHT"]
         self.cell = max(8, min(cell_w, cell_h))
+        # Both panes are the same size, so one pre-rendered background serves both.
+        self.pane_bg = _make_pane_bg(self.left_rect.size, self.cell)
+        # Full-screen dimmers for the countdown and result banner, filled once.
+        self._overlay120 = _make_overlay(self.w, self.h, 120)
+        self._overlay160 = _make_overlay(self.w, self.h, 160)
 
         # Match + round tracking
         self.target_wins = 2
@@ -639,6 +841,7 @@ class BrickDropperScene(Scene):
             self.labels[1],
         )
         self.ai = None if self.net_enabled else AIPlayer(self.right_win)
+        self.sim_acc = 0.0  # unsimulated time carried to the next frame
         self.phase = "READY"
         self.ready_timer = CFG["READY_COUNTDOWN"]
         self.banner_timer = 0.0
@@ -728,6 +931,28 @@ class BrickDropperScene(Scene):
             state["outcome"] = self.pending_outcome
         self._net_send_action(state)
 
+    def _net_send_lock_event(self, locked_left: int, level: int):
+        """Tell the peer where our row stopped; it replays the lock on its mirror pane."""
+        self._net_send_action(
+            {
+                "kind": "lock_event",
+                "from": self.local_id,
+                "round_idx": self.round_idx,
+                "level": level,
+                "left": locked_left,
+            }
+        )
+
+    def _lock_local(self):
+        win = self.left_win
+        r = win.row
+        if not r or win.finished or win.crashed:
+            return
+        locked_left, level = _iround(r.left), r.level
+        win.lock()
+        if self.net_enabled:
+            self._net_send_lock_event(locked_left, level)
+
     def _net_poll_actions(self, dt: float):
         if not self.net_enabled or not self.net_client:
             return
@@ -744,6 +969,24 @@ class BrickDropperScene(Scene):
     def _net_apply_state(self, action: Dict[str, Any]):
         if not action:
             return
+        if action.get("kind") == "lock_event":
+            # Replay the peer's press on our mirror of their pane; a stale or
+            # out-of-step event is dropped and the next full state corrects it.
+            win = self.right_win
+            r = win.row
+            if (
+                r
+                and action.get("round_idx") == self.round_idx
+                and action.get("level") == r.level
+            ):
+                try:
+                    r.left = float(action.get("left", r.left))
+                except (TypeError, ValueError):
+                    return
+                win.lock()
+                if self.phase == "PLAY":
+                    self._check_round_end()
+            return
         board_state = action.get("board")
         if board_state:
             self.right_win.apply_state(board_state)
@@ -825,14 +1068,10 @@ class BrickDropperScene(Scene):
                 self._pause_game()
                 return
             if self.phase == "PLAY" and event.key in (pygame.K_SPACE, pygame.K_RETURN):
-                self.left_win.lock()
-                if self.net_enabled:
-                    self._net_send_state(kind="lock")
+                self._lock_local()
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1 and self.phase == "PLAY":
-                self.left_win.lock()
-                if self.net_enabled:
-                    self._net_send_state(kind="lock")
+                self._lock_local()
 
     def update(self, dt):
         self._net_poll_actions(dt)
@@ -857,12 +1096,16 @@ class BrickDropperScene(Scene):
                 if self.net_sync_timer >= 0.12:
                     self.net_sync_timer = 0.0
                     self._net_send_state(kind="state")
-            if self.ai and self.ai.think(dt):
-                self.right_win.lock()
-                if self.net_enabled:
-                    self._net_send_state(kind="lock")
-            self.left_win.update(dt)
-            self.right_win.update(dt)
+            acc = self.sim_acc + dt
+            while acc >= SIM_STEP:
+                acc -= SIM_STEP
+                if self.ai and self.ai.think(SIM_STEP):
+                    self.right_win.lock()
+                    if self.net_enabled:
+                        self._net_send_state(kind="lock")
+                self.left_win.update(SIM_STEP)
+                self.right_win.update(SIM_STEP)
+            self.sim_acc = acc
             self._check_round_end()
         elif self.phase == "COOLDOWN":
             self.banner_timer -= dt
@@ -885,11 +1128,11 @@ class BrickDropperScene(Scene):
         _draw_match_hud(
             screen, fonts, left_label, right_label, self.p_score, self.n_score, self.target_wins, self.w, self.h
         )
-        self.left_win.draw(screen, self.cell, fonts, is_player=True)
-        self.right_win.draw(screen, self.cell, fonts, is_player=False)
+        self.left_win.draw(screen, self.cell, fonts, is_player=True, bg_surf=self.pane_bg)
+        self.right_win.draw(screen, self.cell, fonts, is_player=False, bg_surf=self.pane_bg)
 
         if self.phase == "READY":
-            _ready_countdown(screen, fonts, self.w, self.h, self.ready_timer)
+            _ready_countdown(screen, fonts, self.w, self.h, self.ready_timer, self._overlay120)
         if self.phase in ("COOLDOWN", "MATCH_END") or self.pending_outcome:
             subtitle = getattr(self, "banner_subtitle", "")
             _draw_result_banner(
@@ -903,15 +1146,13 @@ class BrickDropperScene(Scene):
                 self.target_wins,
                 left_label,
                 right_label,
+                self._overlay160,
             )
             if subtitle:
-                sub_font = self.font_small
-                surf = sub_font.render(subtitle, True, (240, 240, 240))
+                surf = _text(self.font_small, subtitle, (240, 240, 240))
                 screen.blit(surf, surf.get_rect(center=(self.w // 2, self.h // 2 + 80)))
 
-        screen.blit(
-            self.hint_text, (self.w // 2 - self.hint_text.get_width() // 2, self.h - 20)
-        )
+        screen.blit(self.hint_text, self.hint_pos)
 
     # ---- Pause / finalize helpers ----
     def _pause_game(self):
@@ -37,8 +37,133 @@ COL_HALO = (60, 200, 255)
 COL_WARN = (250, 95, 95)
 
 
-def in_bounds(x, y):
-    return 0 <= x < BOARD_W and 0 <= y < BOARD_H
+N_SQUARES = BOARD_W * BOARD_H
+
+KING_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+KNIGHT_OFFSETS = ((1, 2), (2, 1), (-1, 2), (-2, 1), (1, -2), (2, -1), (-1, -2), (-2, -1))
+ORTHO_DIRS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+DIAG_DIRS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+QUEEN_DIRS = ORTHO_DIRS + DIAG_DIRS
+
+# Greedy AI capture scores
+AI_CAPTURE_VALUES = {"K": 100, "Q": 9, "R": 5, "B": 3, "H": 3, "P": 1}
+
+# Piece codes: kind in the low bits, side in bit 3 (white K..P = 1..6,
+# black K..P = 9..14). A position is a list of bitboards indexed by code,
+# bit sq set when that piece stands on sq.
+KIND_CODE = {"K": 1, "Q": 2, "B": 3, "H": 4, "R": 5, "P": 6}
+SIDE_BIT = {"W": 0, "B": 8}
+ENEMY_BIT = 8
+
+# Destination tables per square (sq = y * BOARD_W + x), built once at import.
+SQ_XY = tuple((sq % BOARD_W, sq // BOARD_W) for sq in range(N_SQUARES))
+
+
+def _step_table(offsets):
+    return tuple(
+        tuple(
+            (y + dy) * BOARD_W + x + dx
+            for dx, dy in offsets
+            if 0 <= x + dx < BOARD_W and 0 <= y + dy < BOARD_H
+        )
+        for x, y in SQ_XY
+    )
+
+
+def _ray_table(dirs):
+    table = []
+    for x, y in SQ_XY:
+        rays = []
+        for dx, dy in dirs:
+            ray = []
+            nx, ny = x + dx, y + dy
+            while 0 <= nx < BOARD_W and 0 <= ny < BOARD_H:
+                ray.append(ny * BOARD_W + nx)
+                nx += dx
+                ny += dy
+            if ray:
+                rays.append(tuple(ray))
+        table.append(tuple(rays))
+    return tuple(table)
+
+
+KING_DESTS = _step_table(KING_OFFSETS)
+KNIGHT_DESTS = _step_table(KNIGHT_OFFSETS)
+ORTHO_RAYS = _ray_table(ORTHO_DIRS)
+DIAG_RAYS = _ray_table(DIAG_DIRS)
+SLIDER_RAYS = {"Q": _ray_table(QUEEN_DIRS), "R": ORTHO_RAYS, "B": DIAG_RAYS}
+# Pawn push / capture squares by side (white moves toward y == 0)
+PAWN_PUSH = {
+    side: tuple(
+        (y + dy) * BOARD_W + x if 0 <= y + dy < BOARD_H else None for x, y in SQ_XY
+    )
+    for side, dy in (("W", -1), ("B", 1))
+}
+PAWN_CAPTURES = {
+    side: _step_table(((-1, dy), (1, dy))) for side, dy in (("W", -1), ("B", 1))
+}
+
+
+def _mask_table(table):
+    return tuple(sum(1 << t for t in dests) for dests in table)
+
+
+def _ray_masks(table):
+    # (mask, ascending) per ray: the first blocker on an ascending ray is its
+    # lowest set bit, on a descending ray its highest.
+    return tuple(
+        tuple((sum(1 << t for t in ray), ray[0] > sq) for ray in rays)
+        for sq, rays in enumerate(table)
+    )
+
+
+KING_MASKS = _mask_table(KING_DESTS)
+KNIGHT_MASKS = _mask_table(KNIGHT_DESTS)
+PAWN_CAPTURE_MASKS = {side: _mask_table(t) for side, t in PAWN_CAPTURES.items()}
+ORTHO_RAY_MASKS = _ray_masks(ORTHO_RAYS)
+DIAG_RAY_MASKS = _ray_masks(DIAG_RAYS)
+
+
+# Zobrist keys per (piece code, square) plus one for black to move; fixed seed
+# so both peers of a net duel hash positions the same way.
+_zrng = random.Random(0xC4A7)
+ZOBRIST = tuple(tuple(_zrng.getrandbits(64) for _ in range(N_SQUARES)) for _code in range(15))
+ZOBRIST_BLACK = _zrng.getrandbits(64)
+del _zrng
+
+
+def _occupancy(bbs):
+    occ = 0
+    for bb in bbs:
+        occ |= bb
+    return occ
+
+
+def _lowest_sq(bb):
+    return (bb & -bb).bit_length() - 1 if bb else None
+
+
+def _square_attacked(bbs, occ, sq, by):
+    """True if a piece of side bit ``by`` attacks ``sq`` (``occ`` = all pieces)."""
+    # a white pawn attacks sq from the squares a black pawn on sq would capture
+    if PAWN_CAPTURE_MASKS["B" if by == 0 else "W"][sq] & bbs[KIND_CODE["P"] | by]:
+        return True
+    if KING_MASKS[sq] & bbs[KIND_CODE["K"] | by] or KNIGHT_MASKS[sq] & bbs[KIND_CODE["H"] | by]:
+        return True
+    queens = bbs[KIND_CODE["Q"] | by]
+    for rays, sliders in (
+        (ORTHO_RAY_MASKS[sq], bbs[KIND_CODE["R"] | by] | queens),
+        (DIAG_RAY_MASKS[sq], bbs[KIND_CODE["B"] | by] | queens),
+    ):
+        if not sliders:
+            continue
+        for mask, ascending in rays:
+            blockers = mask & occ
+            if blockers:
+                first = blockers & -blockers if ascending else 1 << (blockers.bit_length() - 1)
+                if first & sliders:
+                    return True
+    return False
 
 
 class Piece:
@@ -59,6 +184,7 @@ class ChatuDuelScene(Scene):
         self.context = context or GameContext()
         self.callback = callback
         self.big, self.font, self.small = load_game_fonts()
+        self._text_cache = {}
         self.screen = manager.screen
         self.w, self.h = manager.size
 
@@ -150,6 +276,14 @@ class ChatuDuelScene(ChatuDuelScene):
             pass
         return None
 
+    def _text(self, font, text, color):
+        """Rendered text, cached; scores and banners change rarely between frames."""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            surf = self._text_cache[key] = font.render(text, True, color)
+        return surf
+
     def _compute_layout(self):
         """Compute background scale/offset and board rect aligned to baked art."""
         self.w, self.h = self.manager.size
@@ -200,11 +334,45 @@ class ChatuDuelScene(ChatuDuelScene):
             self.pieces.append(Piece(kind, "B", x, by_back))
         for x in range(BOARD_W):
             self.pieces.append(Piece("P", "B", x, by_pawn))
+        self._rebuild_board()
 
-    def piece_at(self, x, y):
+    def _rebuild_board(self):
+        """Re-index ``self.pieces`` into the square-indexed ``self.board``."""
+        board = [None] * N_SQUARES
         for p in self.pieces:
-            if p.x == x and p.y == y:
-                return p
+            if 0 <= p.x < BOARD_W and 0 <= p.y < BOARD_H:
+                sq = p.y * BOARD_W + p.x
+                if board[sq] is None:
+                    board[sq] = p
+        self.board = board
+        zkey = 0
+        for sq, p in enumerate(board):
+            if p is not None:
+                zkey ^= ZOBRIST[KIND_CODE[p.kind] | SIDE_BIT[p.side]][sq]
+        self.zkey = zkey
+
+    def _bitboards(self):
+        """Bitboards of the live board, indexed by piece code."""
+        bbs = [0] * 15
+        for sq, p in enumerate(self.board):
+            if p is not None:
+                bbs[KIND_CODE[p.kind] | SIDE_BIT[p.side]] |= 1 << sq
+        return bbs
+
+    def _position_key(self):
+        """Repetition key: the incremental Zobrist hash plus side to move."""
+        return self.zkey ^ ZOBRIST_BLACK if self.turn == "B" else self.zkey
+
+    def _set_kind(self, p, kind):
+        """Change a piece's kind in place (promotion), keeping ``zkey`` current."""
+        sq = p.y * BOARD_W + p.x
+        side = SIDE_BIT[p.side]
+        self.zkey ^= ZOBRIST[KIND_CODE[p.kind] | side][sq] ^ ZOBRIST[KIND_CODE[kind] | side][sq]
+        p.kind = kind
+
+    def piece_at(self, x, y):
+        if 0 <= x < BOARD_W and 0 <= y < BOARD_H:
+            return self.board[y * BOARD_W + x]
         return None
 
     def is_friend(self, side, x, y):
@@ -217,189 +385,92 @@ class ChatuDuelScene(ChatuDuelScene):
 
     # ------------------- move generation (raw) --------------------------------
     def gen_moves_basic(self, p):
-        x, y, side = p.x, p.y, p.side
+        x, y, side, kind = p.x, p.y, p.side, p.kind
+        if not (0 <= x < BOARD_W and 0 <= y < BOARD_H):
+            return []
+        sq = y * BOARD_W + x
+        board = self.board
         mv = []
 
-        if p.kind == "K":
-            for dx in (-1, 0, 1):
-                for dy in (-1, 0, 1):
-                    if dx or dy:
-                        nx, ny = x + dx, y + dy
-                        if in_bounds(nx, ny) and not self.is_friend(side, nx, ny):
-                            mv.append((nx, ny))
-
-        elif p.kind == "Q":
-            mv.extend(
-                self._slide_dirs(
-                    p,
-                    (
-                        (1, 0),
-                        (-1, 0),
-                        (0, 1),
-                        (0, -1),
-                        (1, 1),
-                        (1, -1),
-                        (-1, 1),
-                        (-1, -1),
-                    ),
-                )
-            )
-
-        elif p.kind == "R":
-            mv.extend(self._slide_dirs(p, ((1, 0), (-1, 0), (0, 1), (0, -1))))
-
-        elif p.kind == "B":
-            mv.extend(self._slide_dirs(p, ((1, 1), (1, -1), (-1, 1), (-1, -1))))
-
-        elif p.kind == "H":
-            for dx, dy in (
-                (1, 2),
-                (2, 1),
-                (-1, 2),
-                (-2, 1),
-                (1, -2),
-                (2, -1),
-                (-1, -2),
-                (-2, -1),
-            ):
-                nx, ny = x + dx, y + dy
-                if in_bounds(nx, ny) and not self.is_friend(side, nx, ny):
-                    mv.append((nx, ny))
-
-        elif p.kind == "P":
-            diry = -1 if side == "W" else 1
-            ny = y + diry
+        if kind == "K" or kind == "H":
+            for dst in (KING_DESTS if kind == "K" else KNIGHT_DESTS)[sq]:
+                q = board[dst]
+                if q is None or q.side != side:
+                    mv.append(SQ_XY[dst])
+
+        elif kind in SLIDER_RAYS:
+            for ray in SLIDER_RAYS[kind][sq]:
+                for dst in ray:
+                    q = board[dst]
+                    if q is not None:
+                        if q.side != side:
+                            mv.append(SQ_XY[dst])
+                        break
+                    mv.append(SQ_XY[dst])
+
+        elif kind == "P":
             # advance
-            if in_bounds(x, ny) and not self.piece_at(x, ny):
-                mv.append((x, ny))
+            dst = PAWN_PUSH[side][sq]
+            if dst is not None and board[dst] is None:
+                mv.append(SQ_XY[dst])
             # captures
-            for dx in (-1, 1):
-                nx = x + dx
-                if in_bounds(nx, ny) and self.is_enemy(side, nx, ny):
-                    mv.append((nx, ny))
+            for dst in PAWN_CAPTURES[side][sq]:
+                q = board[dst]
+                if q is not None and q.side != side:
+                    mv.append(SQ_XY[dst])
 
         return mv
 
-    def _slide_dirs(self, p, dirs):
-        mv = []
-        x, y, side = p.x, p.y, p.side
-        for dx, dy in dirs:
-            nx, ny = x + dx, y + dy
-            while in_bounds(nx, ny) and not self.is_friend(side, nx, ny):
-                mv.append((nx, ny))
-                if self.piece_at(nx, ny):
-                    break
-                nx += dx
-                ny += dy
-        return mv
-
-    # --- legality (king safety) via snapshot play
-    def legal_moves_for(self, p):
+    # --- legality (king safety): make/unmake each candidate on bitboards
+    def legal_moves_for(self, p, bbs=None, occ=None):
+        """Legal destinations for ``p``. Callers checking several pieces can
+        share one ``bbs``/``occ`` snapshot; it is restored before returning."""
+        moves = self.gen_moves_basic(p)
+        if not moves:
+            return []
+        if bbs is None:
+            bbs = self._bitboards()
+            occ = _occupancy(bbs)
+        board = self.board
+        src_bit = 1 << (p.y * BOARD_W + p.x)
+        own = SIDE_BIT[p.side]
+        enemy = own ^ ENEMY_BIT
+        code = KIND_CODE[p.kind] | own
+        moving_king = p.kind == "K"
+        king_sq = None if moving_king else _lowest_sq(bbs[KIND_CODE["K"] | own])
         legal = []
-        for nx, ny in self.gen_moves_basic(p):
-            snap = [q.copy() for q in self.pieces]
-            self._apply_move_on_list(snap, (p.x, p.y), (nx, ny))
-            if not self._in_check_on_list(snap, p.side):
+        for nx, ny in moves:
+            dst = ny * BOARD_W + nx
+            dst_bit = 1 << dst
+            victim = board[dst]
+            vcode = KIND_CODE[victim.kind] | SIDE_BIT[victim.side] if victim is not None else 0
+            bbs[code] ^= src_bit | dst_bit
+            if vcode:
+                bbs[vcode] ^= dst_bit
+            ksq = dst if moving_king else king_sq
+            if ksq is None or not _square_attacked(bbs, (occ ^ src_bit) | dst_bit, ksq, enemy):
                 legal.append((nx, ny))
+            bbs[code] ^= src_bit | dst_bit
+            if vcode:
+                bbs[vcode] ^= dst_bit
         return legal
 
-    def _apply_move_on_list(self, plist, src, dst):
-        sx, sy = src
-        dx, dy = dst
-        # capture
-        victim = next((q for q in plist if q.x == dx and q.y == dy), None)
-        if victim:
-            plist.remove(victim)
-        # move
-        for q in plist:
-            if q.x == sx and q.y == sy:
-                q.x, q.y = dx, dy
-                break
-
-    def _in_check_on_list(self, plist, side):
-        # locate king
-        kx = ky = None
-        for q in plist:
-            if q.side == side and q.kind == "K":
-                kx, ky = q.x, q.y
-                break
-        enemy = "B" if side == "W" else "W"
-
-        # build enemy attack set
-        atk = set()
-
-        def occ_friend(x, y, s):
-            return any((r.x == x and r.y == y and r.side == s) for r in plist)
-
-        def occ_any(x, y):
-            return any((r.x == x and r.y == y) for r in plist)
-
-        for q in plist:
-            if q.side != enemy:
-                continue
-            if q.kind == "P":
-                dy = -1 if enemy == "W" else 1
-                ny = q.y + dy
-                for dx in (-1, 1):
-                    nx = q.x + dx
-                    if in_bounds(nx, ny):
-                        atk.add((nx, ny))
-            elif q.kind == "K":
-                for dx in (-1, 0, 1):
-                    for dy in (-1, 0, 1):
-                        if dx or dy:
-                            nx, ny = q.x + dx, q.y + dy
-                            if in_bounds(nx, ny):
-                                atk.add((nx, ny))
-            elif q.kind == "H":
-                for dx, dy in (
-                    (1, 2),
-                    (2, 1),
-                    (-1, 2),
-                    (-2, 1),
-                    (1, -2),
-                    (2, -1),
-                    (-1, -2),
-                    (-2, -1),
-                ):
-                    nx, ny = q.x + dx, q.y + dy
-                    if in_bounds(nx, ny):
-                        atk.add((nx, ny))
-            elif q.kind in ("R", "B", "Q"):
-                dirs = {
-                    "R": ((1, 0), (-1, 0), (0, 1), (0, -1)),
-                    "B": ((1, 1), (1, -1), (-1, 1), (-1, -1)),
-                    "Q": (
-                        (1, 0),
-                        (-1, 0),
-                        (0, 1),
-                        (0, -1),
-                        (1, 1),
-                        (1, -1),
-                        (-1, 1),
-                        (-1, -1),
-                    ),
-                }[q.kind]
-                for dx, dy in dirs:
-                    nx, ny = q.x + dx, q.y + dy
-                    while in_bounds(nx, ny) and not occ_friend(nx, ny, enemy):
-                        atk.add((nx, ny))
-                        if occ_any(nx, ny):
-                            break
-                        nx += dx
-                        ny += dy
-        return (kx, ky) in atk
-
     # ------------------- flow, draws, mercy rule, AI --------------------------
     def _move_piece(self, p, nx, ny):
         """Apply a real move on the live board (handles capture, halfmove clock,
         repetition table, and promotion trigger)."""
         capture = self.piece_at(nx, ny)
+        src, dst = p.y * BOARD_W + p.x, ny * BOARD_W + nx
         if capture:
             self.captured[p.side].append(capture.kind)
             self.pieces.remove(capture)
+            self.zkey ^= ZOBRIST[KIND_CODE[capture.kind] | SIDE_BIT[capture.side]][dst]
 
         pawn_move = p.kind == "P"
+        zpiece = ZOBRIST[KIND_CODE[p.kind] | SIDE_BIT[p.side]]
+        self.zkey ^= zpiece[src] ^ zpiece[dst]
+        self.board[src] = None
+        self.board[dst] = p
         p.x, p.y = nx, ny
 
         # 50-move rule clock
@@ -411,40 +482,23 @@ class ChatuDuelScene(ChatuDuelScene):
                 if p.side == "W":
                     self._begin_promotion_ui(p)  # human picks
                 else:
-                    p.kind = "Q"  # AI auto-queens
+                    self._set_kind(p, "Q")  # AI auto-queens
 
     def _record_position(self):
-        key = (
-            self.turn,
-            tuple(sorted((q.kind, q.side, q.x, q.y) for q in self.pieces)),
-        )
-        self.position_counts[key] += 1
+        self.position_counts[self._position_key()] += 1
 
     def in_check(self, side):
-        kx = ky = None
-        for p in self.pieces:
-            if p.side == side and p.kind == "K":
-                kx, ky = p.x, p.y
-                break
-        enemy = "B" if side == "W" else "W"
-        atk = set()
-        for p in self.pieces:
-            if p.side != enemy:
-                continue
-            if p.kind == "P":
-                dy = -1 if enemy == "W" else 1
-                ny = p.y + dy
-                for dx in (-1, 1):
-                    nx = p.x + dx
-                    if in_bounds(nx, ny):
-                        atk.add((nx, ny))
-            else:
-                for mv in self.gen_moves_basic(p):
-                    atk.add(mv)
-        return (kx, ky) in atk
+        bbs = self._bitboards()
+        own = SIDE_BIT[side]
+        king_sq = _lowest_sq(bbs[KIND_CODE["K"] | own])
+        if king_sq is None:
+            return False
+        return _square_attacked(bbs, _occupancy(bbs), king_sq, own ^ ENEMY_BIT)
 
     def _any_legal_for(self, side):
-        return any(self.legal_moves_for(q) for q in self.pieces if q.side == side)
+        bbs = self._bitboards()
+        occ = _occupancy(bbs)
+        return any(self.legal_moves_for(q, bbs, occ) for q in self.pieces if q.side == side)
 
     def _insufficient_material(self):
         kinds = [p.kind for p in self.pieces]
@@ -456,11 +510,7 @@ class ChatuDuelScene(ChatuDuelScene):
         return minors <= 2
 
     def _draw_reason(self):
-        key = (
-            self.turn,
-            tuple(sorted((q.kind, q.side, q.x, q.y) for q in self.pieces)),
-        )
-        if self.position_counts.get(key, 0) >= 3:
+        if self.position_counts.get(self._position_key(), 0) >= 3:
             print("DEBUG: Threefold repetition triggered")
             return "Draw — threefold repetition"
 
@@ -556,16 +606,16 @@ class ChatuDuelScene(ChatuDuelScene):
         if self.net_enabled:
             return
         cand = []
+        bbs = self._bitboards()
+        occ = _occupancy(bbs)
         for p in self.pieces:
             if p.side != "B":
                 continue
-            for nx, ny in self.legal_moves_for(p):
+            for nx, ny in self.legal_moves_for(p, bbs, occ):
                 victim = self.piece_at(nx, ny)
                 score = 0.0
                 if victim:
-                    score += {"K": 100, "Q": 9, "R": 5, "B": 3, "H": 3, "P": 1}.get(
-                        victim.kind, 1
-                    ) + random.random() * 0.1
+                    score += AI_CAPTURE_VALUES.get(victim.kind, 1) + random.random() * 0.1
                 if p.kind == "P":
                     score += 0.05 * (ny if p.side == "B" else (BOARD_H - 1 - ny))
                 cand.append((score, p, (nx, ny)))
@@ -598,7 +648,7 @@ class ChatuDuelScene(ChatuDuelScene):
     def _handle_promotion_click(self, pos):
         for kind, r in self._promo_rects.items():
             if r.collidepoint(pos):
-                self._promo_pending["piece"].kind = kind
+                self._set_kind(self._promo_pending["piece"], kind)
                 self._promo_pending = None
                 return True
         return False
@@ -733,6 +783,7 @@ class ChatuDuelScene(ChatuDuelScene):
                 continue
         if ps:
             self.pieces = ps
+            self._rebuild_board()
         self.sel, self.legal = None, []
         self._promo_pending = None
         cap = state.get("captured") or {}
@@ -885,16 +936,16 @@ class ChatuDuelScene(ChatuDuelScene):
         w_score, b_score = self._current_scores()
 
         # White score (bottom-left)
-        w_text = self.small.render(f"White Score: {w_score}", True, (220, 220, 255))
+        w_text = self._text(self.small, f"White Score: {w_score}", (220, 220, 255))
         self.screen.blit(w_text, (self.board_rect.left, self.board_rect.bottom + 5))
 
         # Black score (top-left)
-        b_text = self.small.render(f"Black Score: {b_score}", True, (255, 220, 220))
+        b_text = self._text(self.small, f"Black Score: {b_score}", (255, 220, 220))
         self.screen.blit(b_text, (self.board_rect.left, self.board_rect.top - 38))
 
         # Check flash / banners
         if self._flash_timer > 0:
-            t = self.big.render("Check!", True, COL_WARN)
+            t = self._text(self.big, "Check!", COL_WARN)
             self.screen.blit(
                 t,
                 t.get_rect(center=(self.board_rect.centerx, self.board_rect.top - 28)),
@@ -916,7 +967,7 @@ class ChatuDuelScene(ChatuDuelScene):
             bg = (240, 240, 240) if p.side == "W" else (40, 40, 40)
             fg = (10, 10, 10) if p.side == "W" else (240, 240, 240)
             pygame.draw.circle(self.screen, bg, (cx, cy), scale // 2)
-            t = self.font.render(glyph, True, fg)
+            t = self._text(self.font, glyph, fg)
             self.screen.blit(t, t.get_rect(center=(cx, cy)))
             return
 
@@ -940,11 +991,11 @@ class ChatuDuelScene(ChatuDuelScene):
         box.center = (w // 2, h // 2)
         pygame.draw.rect(self.screen, (35, 39, 54), box, border_radius=16)
         pygame.draw.rect(self.screen, (180, 190, 220), box, 2, border_radius=16)
-        t = self.big.render(text, True, (255, 236, 140))
+        t = self._text(self.big, text, (255, 236, 140))
         t_rect = t.get_rect(center=(box.centerx, box.centery - 12))
         self.screen.blit(t, t_rect)
         if subtitle:
-            sub = self.font.render(subtitle, True, (220, 230, 250))
+            sub = self._text(self.font, subtitle, (220, 230, 250))
             self.screen.blit(sub, sub.get_rect(center=(box.centerx, box.centery + 28)))
 
     # --- promotion overlay (Q,R,B,H)
@@ -953,7 +1004,7 @@ class ChatuDuelScene(ChatuDuelScene):
         dim.fill((0, 0, 0, 150))
         self.screen.blit(dim, (0, 0))
 
-        title = self.big.render("Promote to…", True, (255, 236, 140))
+        title = self._text(self.big, "Promote to…", (255, 236, 140))
         self.screen.blit(
             title,
             title.get_rect(center=(self.board_rect.centerx, self.board_rect.top - 28)),
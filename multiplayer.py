@@ -1683,6 +1683,14 @@ class LobbyClient:
         except queue.Empty:
             return None
 
+    def pending_duel_actions(self, duel_id: str) -> int:
+        """Cheap emptiness probe for the per-frame duel poll (no queue mutex)."""
+        q = self._duel_action_queue.get(duel_id) if duel_id else None
+        if not q:
+            return 0
+        # Queue.qsize() takes the mutex; len() on the backing deque does not.
+        return len(q.queue)
+
     def send_duel_action(self, payload: Dict):
         if not self.connected or not payload:
             return